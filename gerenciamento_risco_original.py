@@ -1,30 +1,32 @@
 import decimal
+import functools
 import os
 import time
 
 import ccxt
 from dotenv import load_dotenv
 
-load_dotenv()
+from src.configs.logger_config import logger
 
-binance_api_key = os.getenv("BINANCE_API_KEY")
-binance_api_secret = os.getenv("BINANCE_API_SECRET")
+load_dotenv()
 
+symbols = ["XRPUSDT"]
 
-binance = ccxt.binance(
-    {
-        "enableRateLimit": True,
-        "options": {"defaultType": "future"},
-        "apiKey": binance_api_key,
-        "secret": binance_api_secret,
-    }
-)
 
-symbols = ["XRPUSDT"]
-bal = binance.fetch_positions(symbols=symbols)
+@functools.lru_cache(maxsize=1)
+def get_binance():
+    return ccxt.binance(
+        {
+            "enableRateLimit": True,
+            "options": {"defaultType": "future"},
+            "apiKey": os.getenv("BINANCE_API_KEY"),
+            "secret": os.getenv("BINANCE_API_SECRET"),
+        }
+    )
 
 
 def posicoes_abertas(symbol):
+    binance = get_binance()
     lado = []
     tamanho = []
     preco_entrada = []
@@ -50,6 +52,7 @@ def posicoes_abertas(symbol):
 
 
 def livro_ofertas(symbol):
+    binance = get_binance()
     livro_ofertas = binance.fetch_order_book(symbol)
     bid = decimal.Decimal(livro_ofertas["bids"][0][0])
     ask = decimal.Decimal(livro_ofertas["asks"][0][0])
@@ -57,6 +60,7 @@ def livro_ofertas(symbol):
 
 
 def encerra_posicao(symbol):
+    binance = get_binance()
     pos_aberta = posicoes_abertas(symbol)[3]
     while pos_aberta:
         posicoes_abertas_var = posicoes_abertas(symbol)
@@ -105,12 +109,12 @@ def fecha_pnl(symbol, loss, target):
     if percent:
         if percent < loss:
             encerra_posicao(symbol)
-            print(f"Posição encerrada por stop loss {pnl}")
+            logger.info("Posição encerrada por stop loss %s", pnl)
             # telegram
             # time.sleep(3000)
         elif percent >= target:
             encerra_posicao(symbol)
-            print(f"Posição encerrada por take profit {pnl}")
+            logger.info("Posição encerrada por take profit %s", pnl)
             # telegram
 
 
@@ -127,6 +131,7 @@ def max_tamanho_exposto_atingido(symbol, max_tamanho_exposto):
 
 
 def ultima_ordem_esta_aberta(symbol):
+    binance = get_binance()
     open_orders = binance.fetch_orders(symbol)[-1]["status"]
 
     last_order = open_orders[-1] if len(open_orders) > 0 else None
@@ -1,14 +1,20 @@
+import asyncio
 import decimal
 import os
+import ssl
 import time
-from typing import Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
+import aiohttp
 import ccxt
-import pandas as pd
+import ccxt.pro as ccxtpro
+import numpy as np
 from dotenv import load_dotenv
 
 from src.adapters.exchanges.interfaces.i_futures_trading_adapter import (
+    Candles,
     IFuturesTradingAdapter,
+    PositionSnapshot,
 )
 from src.adapters.notification.interfaces.i_notification_adapter import (
     INotificationAdapter,
@@ -20,103 +26,620 @@ from src.configs.logger_config import logger
 
 load_dotenv()
 
+# Clusters da API de futuros; o de menor RTT é escolhido na primeira chamada.
+_FAPI_HOSTS = (
+    "fapi.binance.com",
+    "fapi1.binance.com",
+    "fapi2.binance.com",
+    "fapi3.binance.com",
+    "fapi4.binance.com",
+)
+
+# Uso (em fração do limite) a partir do qual as chamadas REST esperam a janela virar.
+_USAGE_BACKOFF = 0.8
+_INTERVAL_SECONDS = {"SECOND": 1, "MINUTE": 60, "HOUR": 3600, "DAY": 86400}
+
+
+class _KeepAliveBinance(ccxtpro.binance):
+    def __init__(self, config: Dict[str, Any]) -> None:
+        super().__init__(config)
+        # Cabeçalho de uso da Binance (ex.: "x-mbx-used-weight-1m") ->
+        # (limite, janela em s).
+        self.usage_limits: Dict[str, Tuple[int, int]] = {}
+        self._usage_pause_until = 0.0
+
+    def apply_rate_limits(self, rate_limits: List[Dict[str, Any]]) -> None:
+        """
+        Configures the limiter from the exchangeInfo `rateLimits` entries.
+
+        The request weight budget becomes the refill rate of ccxt's throttler, which
+        already charges each endpoint its Binance weight; every weight and order
+        limit is also watched through the usage headers of the responses. Nothing
+        is applied unless every entry is understood and the throttler is found.
+        """
+        # ccxt < 4.5 expõe o Throttler em `throttle`; a partir da 4.5 ele fica em
+        # `throttler` e `throttle` vira método.
+        throttler = getattr(self, "throttler", None) or self.throttle
+        throttle_config = getattr(throttler, "config", None)
+        if not isinstance(throttle_config, dict):
+            raise TypeError(f"Throttler do ccxt não reconhecido: {throttler!r}")
+
+        usage_limits: Dict[str, Tuple[int, int]] = {}
+        bucket: Dict[str, float] = {}
+        for rule in rate_limits:
+            kind = rule["rateLimitType"]
+            if kind not in ("REQUEST_WEIGHT", "ORDERS"):
+                continue
+            window = _INTERVAL_SECONDS[rule["interval"]] * int(rule["intervalNum"])
+            counter = "used-weight" if kind == "REQUEST_WEIGHT" else "order-count"
+            suffix = f"{rule['intervalNum']}{rule['interval'][0].lower()}"
+            usage_limits[f"x-mbx-{counter}-{suffix}"] = (int(rule["limit"]), window)
+
+            if kind == "REQUEST_WEIGHT":
+                per_second = int(rule["limit"]) / window
+                bucket["refillRate"] = per_second / 1000
+                # Permite rajadas de até um segundo de peso, como entre símbolos.
+                bucket["capacity"] = per_second
+
+        self.usage_limits.update(usage_limits)
+        throttle_config.update(bucket)
+
+    def on_rest_response(
+        self,
+        code: int,
+        reason: str,
+        url: str,
+        method: str,
+        response_headers: Dict[str, str],
+        *args: Any,
+    ) -> Any:
+        now = time.time()
+        for name, value in response_headers.items():
+            limit = self.usage_limits.get(name.lower())
+            if limit is not None and int(value) >= _USAGE_BACKOFF * limit[0]:
+                # O contador zera na virada da janela: segura as chamadas até lá.
+                window = limit[1]
+                resume = now + window - now % window
+                self._usage_pause_until = max(self._usage_pause_until, resume)
+        return super().on_rest_response(
+            code, reason, url, method, response_headers, *args
+        )
+
+    async def fetch2(self, *args: Any, **kwargs: Any) -> Any:
+        delay = self._usage_pause_until - time.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return await super().fetch2(*args, **kwargs)
+
+    def open(self, *args: Any, **kwargs: Any) -> None:
+        # Mesmo fluxo do ccxt, mas com um connector que mantém as conexões TLS
+        # aquecidas entre ticks e cacheia o DNS, em vez dos padrões do aiohttp.
+        # Os argumentos (ex.: o `lazy` das versões 4.5) seguem para o ccxt.
+        if self.own_session and self.session is None:
+            if self.ssl_context is None:
+                self.ssl_context = (
+                    ssl.create_default_context(cafile=self.cafile)
+                    if self.verify
+                    else self.verify
+                )
+            self.tcp_connector = aiohttp.TCPConnector(
+                ssl=self.ssl_context,
+                limit_per_host=8,
+                keepalive_timeout=300,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+            )
+            self.session = aiohttp.ClientSession(
+                connector=self.tcp_connector, trust_env=self.aiohttp_trust_env
+            )
+        super().open(*args, **kwargs)
+
 
 class BinanceFuturesTradingAdapter(IFuturesTradingAdapter):
-    def __init__(self, notification_adapter: INotificationAdapter) -> None:
-        self.binance = ccxt.binance(
+    def __init__(
+        self, notification_adapter: INotificationAdapter, market_data_shards: int = 2
+    ) -> None:
+        # Instância autenticada: REST e streams privados (posições e ordens).
+        self.binance = _KeepAliveBinance(
             {
                 "enableRateLimit": True,
-                "options": {"defaultType": "future"},
+                "options": {
+                    "defaultType": "future",
+                    # fetch_open_orders sem símbolo é intencional no lote.
+                    "warnOnFetchOpenOrdersWithoutSymbol": False,
+                },
                 "apiKey": os.getenv("BINANCE_API_KEY"),
                 "secret": os.getenv("BINANCE_API_SECRET"),
             }
         )
+        # Streams públicos (book, mark price, trades) são distribuídos entre
+        # instâncias próprias, cada uma com suas conexões, para que muitos
+        # símbolos não disputem o mesmo cliente.
+        self._shards = [
+            ccxtpro.binance({"options": {"defaultType": "future"}})
+            for _ in range(max(1, market_data_shards))
+        ]
+        self._shard_by_symbol: Dict[str, Any] = {}
         self._notifier = notification_adapter
+        self._stream_tasks: Dict[str, asyncio.Task] = {}
+        self._positions_cache: Dict[str, Dict[str, Any]] = {}
+        self._positions_synced = False
+        self._orders_cache: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._orders_seeding: Dict[str, List[Dict[str, Any]]] = {}
+        self._mark_prices: Dict[str, float] = {}
+        self._last_prices: Dict[str, float] = {}
+        self._candles: Dict[Tuple[str, str], np.ndarray] = {}
+        self._stale_candles: Set[Tuple[str, str]] = set()
+        self._order_events: Dict[str, asyncio.Event] = {}
+        self._price_formatters: Dict[str, Callable[[float], str]] = {}
+        self._rest_setup: Optional[asyncio.Future] = None
+
+    async def _probe_host(self, host: str) -> float:
+        loop = asyncio.get_running_loop()
+        best = float("inf")
+        # A primeira amostra inclui o handshake TLS; vale a menor das três.
+        for _ in range(3):
+            started = loop.time()
+            async with self.binance.session.get(
+                f"https://{host}/fapi/v1/ping", timeout=aiohttp.ClientTimeout(total=2)
+            ) as response:
+                response.raise_for_status()
+            best = min(best, loop.time() - started)
+        return best
+
+    async def _pick_fastest_endpoint(self) -> None:
+        self.binance.open()
+        results = await asyncio.gather(
+            *(self._probe_host(host) for host in _FAPI_HOSTS), return_exceptions=True
+        )
+        rtts = {
+            host: rtt
+            for host, rtt in zip(_FAPI_HOSTS, results)
+            if not isinstance(rtt, BaseException)
+        }
+        if not rtts:
+            logger.warning("Nenhum endpoint fapi respondeu; mantendo o padrão.")
+            return
+
+        host = min(rtts, key=rtts.get)
+        api_urls = self.binance.urls["api"]
+        for name, url in api_urls.items():
+            if isinstance(url, str) and "://fapi.binance.com/" in url:
+                api_urls[name] = url.replace("://fapi.binance.com/", f"://{host}/")
+        logger.info(f"Endpoint fapi escolhido: {host} ({rtts[host] * 1000:.1f} ms).")
 
-    def get_open_positions(
-        self, symbol: str
-    ) -> Tuple[
-        Optional[str],
-        Optional[float],
-        Optional[float],
-        bool,
-        Optional[float],
-        Optional[float],
-        Optional[float],
-    ]:
-        positions = self.binance.fetch_positions(symbols=[symbol])
-        for position in positions:
-            side = position["side"]
-            size = (
-                float(position["info"]["positionAmt"].replace("-", ""))
-                if position["info"]["positionAmt"]
-                else 0.0
+    async def _load_rate_limits(self) -> None:
+        try:
+            exchange_info = await self.binance.fapiPublicGetExchangeInfo()
+            self.binance.apply_rate_limits(exchange_info.get("rateLimits", []))
+        except Exception as e:
+            logger.warning(
+                f"Falha ao aplicar os limites da API; mantendo os do ccxt: {e}"
             )
-            entry_price = float(position["entryPrice"])
-            notional = float(position["notional"])
-            percentage = float(position["percentage"])
-            pnl = float(position["info"]["unRealizedProfit"])
-            position_open = side in ["long", "short"]
-            return side, size, entry_price, position_open, notional, percentage, pnl
-
-        return None, None, None, False, None, None, None
-
-    def get_order_book(self, symbol: str) -> Tuple[decimal.Decimal, decimal.Decimal]:
-        order_book = self.binance.fetch_order_book(symbol)
-        bid = decimal.Decimal(order_book["bids"][0][0])
-        ask = decimal.Decimal(order_book["asks"][0][0])
-        return bid, ask
-
-    def close_position(self, symbol: str) -> None:
+
+    async def _setup_rest(self) -> None:
+        # As duas etapas são otimizações: uma falha mantém os padrões do ccxt em
+        # vez de derrubar as chamadas do adapter.
+        try:
+            await self._pick_fastest_endpoint()
+        except Exception as e:
+            logger.warning(f"Falha ao escolher endpoint fapi; mantendo o padrão: {e}")
+        await self._load_rate_limits()
+
+    async def _market_symbol(self, symbol: str) -> str:
+        if self._rest_setup is None:
+            self._rest_setup = asyncio.ensure_future(self._setup_rest())
+        try:
+            # Blindada: o cancelamento de um chamador não cancela a preparação
+            # compartilhada com os demais.
+            await asyncio.shield(self._rest_setup)
+        except Exception:
+            # A próxima chamada refaz a preparação, em vez de repetir o mesmo
+            # erro pelo resto do processo.
+            self._rest_setup = None
+            raise
+        await self.binance.load_markets()
+        return self.binance.market(symbol)["symbol"]
+
+    def _shard(self, market_symbol: str) -> Any:
+        shard = self._shard_by_symbol.get(market_symbol)
+        if shard is None:
+            # Distribuição round-robin na primeira vez que o símbolo aparece.
+            shard = self._shards[len(self._shard_by_symbol) % len(self._shards)]
+            if not shard.markets:
+                # Reaproveita os mercados já carregados: sem REST extra no shard.
+                shard.set_markets(self.binance.markets, self.binance.currencies)
+            self._shard_by_symbol[market_symbol] = shard
+        return shard
+
+    def _to_price(self, symbol: str, price: float) -> str:
+        # Equivale ao price_to_precision, com um formatador especializado por
+        # símbolo: tick e casas decimais ficam fixos na closure.
+        formatter = self._price_formatters.get(symbol)
+        if formatter is None:
+            tick = float(self.binance.market(symbol)["precision"]["price"])
+            decimals = max(0, -decimal.Decimal(str(tick)).as_tuple().exponent)
+            to_text = f"{{:.{decimals}f}}".format
+
+            def formatter(px: float) -> str:
+                rounded = round(px / tick) * tick
+                # Preço zerado (ou abaixo de meio tick) viraria uma ordem
+                # inválida na corretora: falha aqui, antes do envio.
+                if rounded <= 0:
+                    raise ValueError(f"Preço inválido para {symbol}: {px}")
+                return to_text(rounded)
+
+            self._price_formatters[symbol] = formatter
+
+        return formatter(price)
+
+    async def _run_stream(
+        self,
+        name: str,
+        watch: Callable[[], Awaitable[Any]],
+        on_update: Callable[[Any], None],
+        on_error: Callable[[], None],
+    ) -> None:
+        while True:
+            try:
+                on_update(await watch())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Erro no stream {name}: {e}")
+                on_error()
+                await asyncio.sleep(1)
+
+    def _ensure_stream(self, name: str, stream: Callable[[], Awaitable[None]]) -> None:
+        if name not in self._stream_tasks:
+            self._stream_tasks[name] = asyncio.create_task(stream())
+
+    def _ensure_book_stream(self, symbol: str, market_symbol: str) -> None:
+        shard = self._shard(market_symbol)
+        # bookTicker é enviado em tempo real, ao contrário do @depth@100ms.
+        self._ensure_stream(
+            f"book:{symbol}",
+            lambda: self._run_stream(
+                f"book:{symbol}",
+                lambda: shard.watch_bids_asks([market_symbol]),
+                lambda _: None,
+                lambda: shard.bidsasks.pop(market_symbol, None),
+            ),
+        )
+
+    def _ensure_mark_price_stream(self, symbol: str, market_symbol: str) -> None:
+        def on_update(ticker: Dict[str, Any]) -> None:
+            if ticker.get("markPrice") is not None:
+                self._mark_prices[market_symbol] = float(ticker["markPrice"])
+
+        shard = self._shard(market_symbol)
+        self._ensure_stream(
+            f"mark:{symbol}",
+            lambda: self._run_stream(
+                f"mark:{symbol}",
+                lambda: shard.watch_mark_price(market_symbol),
+                on_update,
+                lambda: self._mark_prices.pop(market_symbol, None),
+            ),
+        )
+
+    def _ensure_trades_stream(self, symbol: str, market_symbol: str) -> None:
+        def on_update(trades: List[Dict[str, Any]]) -> None:
+            if trades:
+                self._last_prices[market_symbol] = float(trades[-1]["price"])
+
+        shard = self._shard(market_symbol)
+        self._ensure_stream(
+            f"trades:{symbol}",
+            lambda: self._run_stream(
+                f"trades:{symbol}",
+                lambda: shard.watch_trades(market_symbol),
+                on_update,
+                lambda: self._last_prices.pop(market_symbol, None),
+            ),
+        )
+
+    @staticmethod
+    def _merge_candles(
+        candles: np.ndarray, ohlcv: List[List[float]], timeframe_ms: int
+    ) -> bool:
+        # Buffer (6, limit) de tamanho fixo em ordem cronológica, um campo por
+        # linha: o candle em formação é sobrescrito e um candle novo desloca a
+        # janela sem realocar.
+        for candle in ohlcv:
+            last_time = candles[0, -1]
+            if candle[0] == last_time:
+                candles[:, -1] = candle
+            elif candle[0] == last_time + timeframe_ms:
+                candles[:, :-1] = candles[:, 1:]
+                candles[:, -1] = candle
+            elif candle[0] > last_time:
+                # Candles perdidos no meio: só um novo snapshot REST resolve.
+                return False
+        return True
+
+    def _ensure_ohlcv_stream(
+        self, symbol: str, market_symbol: str, timeframe: str
+    ) -> None:
+        key = (market_symbol, timeframe)
+        timeframe_ms = self.binance.parse_timeframe(timeframe) * 1000
+
+        def on_update(ohlcv: List[List[float]]) -> None:
+            # Sem buffer sincronizado não há base para mesclar: o próximo
+            # load_candles completa o que faltar via REST.
+            candles = self._candles.get(key)
+            if candles is None or key in self._stale_candles:
+                return
+            if not self._merge_candles(candles, ohlcv, timeframe_ms):
+                self._stale_candles.add(key)
+
+        shard = self._shard(market_symbol)
+        self._ensure_stream(
+            f"ohlcv:{symbol}:{timeframe}",
+            lambda: self._run_stream(
+                f"ohlcv:{symbol}:{timeframe}",
+                lambda: shard.watch_ohlcv(market_symbol, timeframe),
+                on_update,
+                lambda: self._stale_candles.add(key),
+            ),
+        )
+
+    def _ensure_positions_stream(self) -> None:
+        def on_update(positions: List[Dict[str, Any]]) -> None:
+            for position in positions:
+                self._cache_position(position)
+            self._positions_synced = True
+
+        def on_error() -> None:
+            # Até o stream voltar, get_open_positions recorre ao REST.
+            self._positions_synced = False
+
+        self._ensure_stream(
+            "positions",
+            lambda: self._run_stream(
+                "positions", self.binance.watch_positions, on_update, on_error
+            ),
+        )
+
+    def _ensure_orders_stream(self) -> None:
+        def on_update(orders: List[Dict[str, Any]]) -> None:
+            for order in orders:
+                if order["status"] == "closed" and order["id"] in self._order_events:
+                    self._order_events[order["id"]].set()
+                # Símbolos ainda não consultados são semeados via REST depois;
+                # com o REST em curso, o evento fica retido e é aplicado sobre
+                # o snapshot, senão uma execução nesse meio-tempo deixaria a
+                # ordem "aberta" no cache.
+                open_orders = self._orders_cache.get(order["symbol"])
+                if open_orders is not None:
+                    self._apply_order_update(open_orders, order)
+                elif order["symbol"] in self._orders_seeding:
+                    self._orders_seeding[order["symbol"]].append(order)
+
+        self._ensure_stream(
+            "orders",
+            lambda: self._run_stream(
+                "orders",
+                self.binance.watch_orders,
+                on_update,
+                self._orders_cache.clear,
+            ),
+        )
+
+    @staticmethod
+    def _apply_order_update(
+        open_orders: Dict[str, Dict[str, Any]], order: Dict[str, Any]
+    ) -> None:
+        if order["status"] == "open":
+            open_orders[order["id"]] = order
+        else:
+            open_orders.pop(order["id"], None)
+
+    def _cache_position(self, position: Dict[str, Any]) -> None:
+        market_symbol = position["symbol"]
+        if not position.get("contracts"):
+            self._positions_cache.pop(market_symbol, None)
+            return
+
+        # Eventos ACCOUNT_UPDATE não trazem notional/percentage/margem inicial:
+        # preserva os campos do snapshot REST que o evento deixa em branco.
+        cached = self._positions_cache.get(market_symbol, {})
+        cached.update({k: v for k, v in position.items() if v is not None})
+        self._positions_cache[market_symbol] = cached
+
+    def _is_position_stale(self, market_symbol: str) -> bool:
+        position = self._positions_cache.get(market_symbol)
+        return position is not None and (
+            not position.get("initialMarginPercentage")
+            or market_symbol not in self._mark_prices
+        )
+
+    def _position_snapshot(self, position: Dict[str, Any]) -> PositionSnapshot:
+        side = position["side"]
+        size = abs(float(position["contracts"] or 0.0))
+        entry_price = float(position["entryPrice"])
+        notional = float(position["notional"] or 0.0)
+        percentage = float(position["percentage"] or 0.0)
+        pnl = float(position["unrealizedPnl"] or 0.0)
+        position_open = side in ["long", "short"]
+
+        # Reavalia PnL pelo mark price do stream, como a Binance faz no REST.
+        mark_price = self._mark_prices.get(position["symbol"])
+        margin_rate = position.get("initialMarginPercentage")
+        if position_open and mark_price is not None and margin_rate:
+            direction = 1.0 if side == "long" else -1.0
+            pnl = (mark_price - entry_price) * size * direction
+            notional = mark_price * size
+            percentage = pnl / (notional * float(margin_rate)) * 100
+
+        return PositionSnapshot(
+            side=side,
+            size=size,
+            entry_price=entry_price,
+            position_open=position_open,
+            notional=notional,
+            percent=percentage,
+            pnl=pnl,
+        )
+
+    async def get_open_positions(self, symbol: str) -> PositionSnapshot:
+        return (await self.get_open_positions_batch([symbol]))[symbol]
+
+    async def _cached_positions(
+        self, symbols: List[str]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        market_symbols = {
+            symbol: await self._market_symbol(symbol) for symbol in symbols
+        }
+        self._ensure_positions_stream()
+        for symbol, market_symbol in market_symbols.items():
+            self._ensure_mark_price_stream(symbol, market_symbol)
+
+        # Posições abertas após o boot chegam só pelo ACCOUNT_UPDATE, sem margem
+        # inicial; sem ela (ou sem mark price) o percentual ficaria congelado,
+        # então esses símbolos também são relidos via REST.
+        stale = [
+            symbol
+            for symbol, market_symbol in market_symbols.items()
+            if not self._positions_synced or self._is_position_stale(market_symbol)
+        ]
+        if stale:
+            for symbol in stale:
+                self._positions_cache.pop(market_symbols[symbol], None)
+            for position in await self.binance.fetch_positions(symbols=stale):
+                self._cache_position(position)
+
+        return {
+            symbol: self._positions_cache.get(market_symbol)
+            for symbol, market_symbol in market_symbols.items()
+        }
+
+    async def get_open_positions_batch(
+        self, symbols: List[str]
+    ) -> Dict[str, PositionSnapshot]:
+        return {
+            symbol: self._position_snapshot(position)
+            if position is not None
+            else PositionSnapshot()
+            for symbol, position in (await self._cached_positions(symbols)).items()
+        }
+
+    async def get_position_size(self, symbol: str) -> Optional[float]:
+        position = (await self._cached_positions([symbol]))[symbol]
+        if position is None:
+            return None
+        return abs(float(position["contracts"] or 0.0))
+
+    async def get_order_book(self, symbol: str) -> Tuple[float, float]:
+        market_symbol = await self._market_symbol(symbol)
+        self._ensure_book_stream(symbol, market_symbol)
+        # O ccxt já entrega bid/ask como float: repassa sem reconverter; o
+        # único texto gerado no caminho da ordem é o do _to_price.
+        top = self._shard(market_symbol).bidsasks.get(market_symbol)
+        if top and top["bid"] is not None and top["ask"] is not None:
+            return top["bid"], top["ask"]
+
+        # Stream ainda sem snapshot: recorre ao REST apenas nesta chamada. Só o
+        # topo é usado, então pede a menor profundidade aceita (peso 2, não 10).
+        order_book = await self.binance.fetch_order_book(symbol, limit=5)
+        return order_book["bids"][0][0], order_book["asks"][0][0]
+
+    async def close_position(
+        self, symbol: str, position: Optional[PositionSnapshot] = None
+    ) -> None:
         logger.info(f"Fechando posição para {symbol}...")
+        self._ensure_orders_stream()
+        order = None
         while True:
-            side, size, _, position_open, _, _, _ = self.get_open_positions(symbol)
+            if position is None:
+                position = await self.get_open_positions(symbol)
+            side, size = position.side, position.size
+            position_open = position.position_open
+            # Snapshot recebido só vale para a primeira iteração.
+            position = None
             if not position_open:
                 logger.info(f"Nenhuma posição aberta em {symbol}.")
                 break
 
-            self.binance.cancel_all_orders(symbol)
-            bid, ask = self.get_order_book(symbol)
-
-            if side == "long":
-                ask_price = self.binance.price_to_precision(symbol, float(ask))
-                self.binance.create_order(
-                    symbol=symbol,
-                    type="limit",
-                    side="sell",
-                    price=ask_price,
-                    amount=size,
-                    params={"hedged": True},
+            if order is None:
+                # Cancelamento e leitura do book são independentes: rodam em paralelo.
+                _, (bid, ask) = await asyncio.gather(
+                    self.binance.cancel_all_orders(symbol), self.get_order_book(symbol)
                 )
-            elif side == "short":
-                bid_price = self.binance.price_to_precision(symbol, float(bid))
-                self.binance.create_order(
+            else:
+                bid, ask = await self.get_order_book(symbol)
+
+            close_side = "sell" if side == "long" else "buy"
+            price = self._to_price(symbol, ask if side == "long" else bid)
+
+            if order is None:
+                order = await self.binance.create_order(
                     symbol=symbol,
                     type="limit",
-                    side="buy",
-                    price=bid_price,
+                    side=close_side,
+                    price=price,
                     amount=size,
                     params={"hedged": True},
                 )
+            else:
+                try:
+                    # Reposiciona a ordem em repouso numa única chamada, sem deixar
+                    # a posição descoberta entre cancelamento e criação.
+                    order = await self.binance.edit_order(
+                        order["id"], symbol, "limit", close_side, order["amount"], price
+                    )
+                except ccxt.ExchangeError as e:
+                    logger.warning(f"Falha ao reposicionar ordem em {symbol}: {e}")
+                    # O stream de posições pode ainda não refletir a execução:
+                    # confirma o estado da ordem antes de recriá-la, para não
+                    # reabrir a posição no sentido oposto.
+                    previous = await self.binance.fetch_order(order["id"], symbol)
+                    if previous["status"] == "closed":
+                        logger.info(f"Ordem de fechamento executada em {symbol}.")
+                        break
+                    # Cancelada no meio do caminho: a próxima iteração relê a
+                    # posição e, se preciso, recria a ordem.
+                    order = None
+                    continue
 
-            logger.info("Aguardando execução da ordem de fechamento...")
-            time.sleep(20)
+            if order["status"] != "closed":
+                logger.info("Aguardando execução da ordem de fechamento...")
+                # Acorda assim que o stream de ordens notificar a execução
+                # total; o timeout só reposiciona a ordem no topo do book.
+                filled = self._order_events.setdefault(order["id"], asyncio.Event())
+                try:
+                    await asyncio.wait_for(filled.wait(), timeout=5)
+                except asyncio.TimeoutError:
+                    continue
+                finally:
+                    self._order_events.pop(order["id"], None)
 
-    def close_pnl_position(self, symbol: str, loss: float, target: float) -> None:
-        side, size, entry_price, position_open, _, percent, pnl = (
-            self.get_open_positions(symbol)
-        )
-        if percent is not None and position_open:
-            percent_rounded = round(percent, 2)
-            pnl_rounded = round(pnl, 2)
-            size_rounded = round(size, 4) if size else 0.0
-            entry_price_rounded = round(entry_price, 2) if entry_price else 0.0
+            logger.info(f"Ordem de fechamento executada em {symbol}.")
+            break
+
+    async def close_pnl_position(
+        self,
+        symbol: str,
+        loss: float,
+        target: float,
+        position: Optional[PositionSnapshot] = None,
+    ) -> None:
+        if position is None:
+            position = await self.get_open_positions(symbol)
+        if position.percent is not None and position.position_open:
+            side = position.side
+            percent_rounded = round(position.percent, 2)
+            pnl_rounded = round(position.pnl, 2)
+            size_rounded = round(position.size, 4) if position.size else 0.0
+            entry_price_rounded = (
+                round(position.entry_price, 2) if position.entry_price else 0.0
+            )
 
             if percent_rounded < loss:
                 logger.info(
                     f"[STOP-LOSS] {symbol}: {percent_rounded}%. Fechando posição..."
                 )
-                self.close_position(symbol)
+                await self.close_position(symbol, position=position)
                 message = FutureTradingMessages.create_stop_loss_message(
                     symbol=symbol,
                     side=side,
@@ -131,7 +654,7 @@ class BinanceFuturesTradingAdapter(IFuturesTradingAdapter):
                 logger.info(
                     f"[TAKE-PROFIT] {symbol}: {percent_rounded}%. Fechando posição..."
                 )
-                self.close_position(symbol)
+                await self.close_position(symbol, position=position)
                 message = FutureTradingMessages.create_take_profit_message(
                     symbol=symbol,
                     side=side,
@@ -142,69 +665,202 @@ class BinanceFuturesTradingAdapter(IFuturesTradingAdapter):
                 )
                 self._notifier.send_message(message)
 
-    def has_exceeded_max_size(self, symbol: str, max_size: float) -> bool:
-        _, size, _, _, _, _, _ = self.get_open_positions(symbol)
-        if size and size >= max_size:
+    async def has_exceeded_max_size(
+        self,
+        symbol: str,
+        max_size: float,
+        position: Optional[PositionSnapshot] = None,
+    ) -> bool:
+        size = (
+            position.size
+            if position is not None
+            else await self.get_position_size(symbol)
+        )
+        if self._exceeds_max_size(size, max_size):
             logger.info(f"{symbol}: tamanho {size} excede máximo {max_size}.")
             return True
         return False
 
-    def is_last_order_open(self, symbol: str) -> bool:
-        open_orders = self.binance.fetch_orders(symbol)
-        if not open_orders:
-            return False
-        return open_orders[-1]["status"] == "open"
+    @staticmethod
+    def _exceeds_max_size(size: Optional[float], max_size: float) -> bool:
+        return bool(size) and size >= max_size
 
-    def load_candles(
-        self, symbol: str, timeframe: str, limit: int = 48
-    ) -> pd.DataFrame:
-        df = self.binance.fetch_ohlcv(symbol, timeframe, limit=limit)
-        df = pd.DataFrame(
-            df, columns=["time", "open", "high", "low", "close", "volume"]
+    @staticmethod
+    def _conflicts_side(side: Optional[str], expected_side: str) -> bool:
+        return (expected_side == "long" and side == "short") or (
+            expected_side == "short" and side == "long"
         )
-        df["time"] = pd.to_datetime(df["time"], unit="ms", utc=True).map(
-            lambda x: x.tz_convert("America/Sao_Paulo")
+
+    async def is_last_order_open(self, symbol: str) -> bool:
+        return (await self.is_last_order_open_batch([symbol]))[symbol]
+
+    async def is_last_order_open_batch(self, symbols: List[str]) -> Dict[str, bool]:
+        market_symbols = {
+            symbol: await self._market_symbol(symbol) for symbol in symbols
+        }
+        self._ensure_orders_stream()
+
+        unseeded = {
+            market_symbol
+            for market_symbol in market_symbols.values()
+            if market_symbol not in self._orders_cache
+        }
+        if unseeded:
+            # Primeira consulta dos símbolos: semeia o cache só com as ordens
+            # abertas. Com vários símbolos novos, uma única chamada sem filtro
+            # substitui uma por símbolo e é separada localmente.
+            pending = {
+                market_symbol: self._orders_seeding.setdefault(market_symbol, [])
+                for market_symbol in unseeded
+            }
+            try:
+                if len(unseeded) == 1:
+                    orders = await self.binance.fetch_open_orders(next(iter(unseeded)))
+                else:
+                    orders = await self.binance.fetch_open_orders()
+            finally:
+                for market_symbol in unseeded:
+                    self._orders_seeding.pop(market_symbol, None)
+            for market_symbol in unseeded:
+                self._orders_cache[market_symbol] = {}
+            for order in orders:
+                if order["symbol"] in unseeded:
+                    self._orders_cache[order["symbol"]][order["id"]] = order
+            # Eventos do stream recebidos durante o REST valem sobre o snapshot.
+            for market_symbol, events in pending.items():
+                for order in events:
+                    self._apply_order_update(self._orders_cache[market_symbol], order)
+
+        return {
+            symbol: bool(self._orders_cache[market_symbol])
+            for symbol, market_symbol in market_symbols.items()
+        }
+
+    async def load_candles(
+        self, symbol: str, timeframe: str, limit: int = 48
+    ) -> Candles:
+        market_symbol = await self._market_symbol(symbol)
+        self._ensure_ohlcv_stream(symbol, market_symbol, timeframe)
+        key = (market_symbol, timeframe)
+        candles = self._candles.get(key)
+
+        if (
+            candles is not None
+            and candles.shape[1] == limit
+            and key in self._stale_candles
+        ):
+            # Stream interrompido: busca só os dois últimos candles e mescla.
+            delta = await self.binance.fetch_ohlcv(
+                symbol, timeframe, since=int(candles[0, -1]), limit=2
+            )
+            timeframe_ms = self.binance.parse_timeframe(timeframe) * 1000
+            if self._merge_candles(candles, delta, timeframe_ms):
+                self._stale_candles.discard(key)
+            else:
+                candles = None
+
+        if candles is None or candles.shape[1] != limit:
+            # Semeia a janela via REST; o stream kline mantém o resto.
+            ohlcv = await self.binance.fetch_ohlcv(symbol, timeframe, limit=limit)
+            candles = np.ascontiguousarray(
+                np.asarray(ohlcv, dtype=np.float64).reshape(-1, 6).T
+            )
+            self._candles[key] = candles
+            self._stale_candles.discard(key)
+
+        # Cada linha do buffer já é um vetor contíguo (SoA): os campos saem
+        # como views, sem cópia nem alocação por tick.
+        return Candles(*candles)
+
+    async def close_allowed_positions(
+        self,
+        symbol: str,
+        loss: float,
+        target: float,
+        position: Optional[PositionSnapshot] = None,
+    ) -> None:
+        await self.close_allowed_positions_batch(
+            [symbol],
+            loss=loss,
+            target=target,
+            positions=None if position is None else {symbol: position},
         )
-        return df
 
-    def close_allowed_positions(self, symbol: str, loss: float, target: float) -> None:
+    async def close_allowed_positions_batch(
+        self,
+        symbols: List[str],
+        loss: float,
+        target: float,
+        positions: Optional[Dict[str, PositionSnapshot]] = None,
+    ) -> None:
         try:
-            self.binance.cancel_all_orders(symbol=symbol)
-            self.close_pnl_position(symbol=symbol, loss=loss, target=target)
+            cancels = asyncio.gather(
+                *(self.binance.cancel_all_orders(symbol=s) for s in symbols)
+            )
+            if positions is None:
+                _, positions = await asyncio.gather(
+                    cancels, self.get_open_positions_batch(symbols)
+                )
+            else:
+                await cancels
         except Exception as e:
-            logger.error(f"Erro ao gerenciar posições para {symbol}: {e}")
+            logger.error(f"Erro ao gerenciar posições para {', '.join(symbols)}: {e}")
+            return
+
+        async def close_symbol(symbol: str) -> None:
+            try:
+                await self.close_pnl_position(
+                    symbol=symbol, loss=loss, target=target, position=positions[symbol]
+                )
+            except Exception as e:
+                logger.error(f"Erro ao gerenciar posições para {symbol}: {e}")
+
+        await asyncio.gather(*(close_symbol(symbol) for symbol in symbols))
 
-    def can_open_position_by_default_rule(
-        self, symbol: str, max_size: float, expected_side: str
+    async def can_open_position_by_default_rule(
+        self,
+        symbol: str,
+        max_size: float,
+        expected_side: str,
+        position: Optional[PositionSnapshot] = None,
     ) -> bool:
-        if self.has_exceeded_max_size(symbol, max_size):
+        if position is None:
+            position = await self.get_open_positions(symbol)
+        if await self.has_exceeded_max_size(symbol, max_size, position=position):
             return False
 
-        current_side = self.get_open_positions(symbol)[0]
-        if (expected_side == "long" and current_side == "short") or (
-            expected_side == "short" and current_side == "long"
-        ):
+        if self._conflicts_side(position.side, expected_side):
             return False
 
-        if self.is_last_order_open(symbol):
+        if await self.is_last_order_open(symbol):
             return False
 
         return True
 
-    def get_last_trade_price(self, symbol: str) -> Optional[float]:
-        trades = self.binance.fetch_trades(symbol, limit=1)
-        if not trades:
-            return None
-        price = float(self.binance.price_to_precision(symbol, trades[0]["price"]))
-        return price
+    async def get_last_trade_price(self, symbol: str) -> Optional[float]:
+        market_symbol = await self._market_symbol(symbol)
+        self._ensure_trades_stream(symbol, market_symbol)
+        price = self._last_prices.get(market_symbol)
+        if price is None:
+            # Stream ainda sem negócios: usa o meio do book se o stream de
+            # bid/ask já tiver snapshot; só sem ele recorre ao REST.
+            top = self._shard(market_symbol).bidsasks.get(market_symbol)
+            if top and top["bid"] is not None and top["ask"] is not None:
+                price = (top["bid"] + top["ask"]) / 2
+            else:
+                trades = await self.binance.fetch_trades(symbol, limit=1)
+                if not trades:
+                    return None
+                price = trades[0]["price"]
+        return float(self._to_price(symbol, price))
 
-    def open_position(self, symbol: str, side: str, amount: float) -> None:
+    async def open_position(self, symbol: str, side: str, amount: float) -> None:
         logger.info(f"Abrindo posição {side.upper()} em {symbol}, size={amount}...")
         try:
-            bid, ask = self.get_order_book(symbol)
+            bid, ask = await self.get_order_book(symbol)
             if side == "long":
-                bid_price = self.binance.price_to_precision(symbol, float(bid))
-                self.binance.create_order(
+                bid_price = self._to_price(symbol, bid)
+                await self.binance.create_order(
                     symbol=symbol,
                     type="limit",
                     side="buy",
@@ -213,8 +869,8 @@ class BinanceFuturesTradingAdapter(IFuturesTradingAdapter):
                     params={"hedged": True},
                 )
             elif side == "short":
-                ask_price = self.binance.price_to_precision(symbol, float(ask))
-                self.binance.create_order(
+                ask_price = self._to_price(symbol, ask)
+                await self.binance.create_order(
                     symbol=symbol,
                     type="limit",
                     side="sell",
@@ -224,3 +880,10 @@ class BinanceFuturesTradingAdapter(IFuturesTradingAdapter):
                 )
         except Exception as e:
             logger.error(f"Erro ao abrir posição {side.upper()} em {symbol}: {e}")
+
+    async def close(self) -> None:
+        for task in self._stream_tasks.values():
+            task.cancel()
+        await asyncio.gather(*self._stream_tasks.values(), return_exceptions=True)
+        self._stream_tasks.clear()
+        await asyncio.gather(self.binance.close(), *(s.close() for s in self._shards))
@@ -1,82 +1,163 @@
-import decimal
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple
+from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
-import pandas as pd
+import numpy as np
+
+
+class PositionSnapshot(NamedTuple):
+    """
+    Point-in-time view of the position held in a symbol.
+    """
+
+    side: Optional[str] = None
+    size: Optional[float] = None
+    entry_price: Optional[float] = None
+    position_open: bool = False
+    notional: Optional[float] = None
+    percent: Optional[float] = None
+    pnl: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class Candles:
+    """
+    OHLCV window in columnar layout: one contiguous float64 array per field,
+    oldest candle first. `time` holds the open time in epoch milliseconds.
+
+    The arrays may be views over a buffer the adapter keeps updating, so read
+    them before the next await or copy them.
+    """
+
+    time: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
 
 
 class IFuturesTradingAdapter(ABC):
     @abstractmethod
-    def get_open_positions(
-        self, symbol: str
-    ) -> Tuple[
-        Optional[str],
-        Optional[float],
-        Optional[float],
-        bool,
-        Optional[float],
-        Optional[float],
-        Optional[float],
-    ]:
+    async def get_open_positions(self, symbol: str) -> PositionSnapshot:
         """
         Fetches the open position for the given symbol.
         """
         pass
 
     @abstractmethod
-    def get_order_book(self, symbol: str) -> Tuple[decimal.Decimal, decimal.Decimal]:
+    async def get_open_positions_batch(
+        self, symbols: List[str]
+    ) -> Dict[str, PositionSnapshot]:
+        """
+        Fetches the open positions for several symbols at once, keyed by symbol.
+        """
+        pass
+
+    @abstractmethod
+    async def get_position_size(self, symbol: str) -> Optional[float]:
+        """
+        Fetches only the size of the open position for the given symbol.
+        """
+        pass
+
+    @abstractmethod
+    async def get_order_book(self, symbol: str) -> Tuple[float, float]:
         """
         Fetches the order book for the given symbol.
         """
         pass
 
     @abstractmethod
-    def close_position(self, symbol: str) -> None:
+    async def close_position(
+        self, symbol: str, position: Optional[PositionSnapshot] = None
+    ) -> None:
         """
         Closes the current position for the given symbol.
         """
         pass
 
     @abstractmethod
-    def close_pnl_position(self, symbol: str, loss: float, target: float) -> None:
+    async def close_pnl_position(
+        self,
+        symbol: str,
+        loss: float,
+        target: float,
+        position: Optional[PositionSnapshot] = None,
+    ) -> None:
         """
         Closes a position based on profit or loss thresholds.
         """
         pass
 
     @abstractmethod
-    def has_exceeded_max_size(self, symbol: str, max_size: float) -> bool:
+    async def has_exceeded_max_size(
+        self,
+        symbol: str,
+        max_size: float,
+        position: Optional[PositionSnapshot] = None,
+    ) -> bool:
         """
         Checks if the current position size exceeds the maximum allowed size.
         """
         pass
 
     @abstractmethod
-    def is_last_order_open(self, symbol: str) -> bool:
+    async def is_last_order_open(self, symbol: str) -> bool:
         """
         Checks if there is a pending open order for the given symbol.
         """
         pass
 
     @abstractmethod
-    def load_candles(
+    async def is_last_order_open_batch(self, symbols: List[str]) -> Dict[str, bool]:
+        """
+        Checks for pending open orders on several symbols at once, keyed by symbol.
+        """
+        pass
+
+    @abstractmethod
+    async def load_candles(
         self, symbol: str, timeframe: str, limit: int = 48
-    ) -> pd.DataFrame:
+    ) -> Candles:
         """
         Loads candlestick data (OHLCV) for the given symbol and timeframe.
         """
         pass
 
     @abstractmethod
-    def close_allowed_positions(self, symbol: str, loss: float, target: float) -> None:
+    async def close_allowed_positions(
+        self,
+        symbol: str,
+        loss: float,
+        target: float,
+        position: Optional[PositionSnapshot] = None,
+    ) -> None:
         """
         Clears old positions and cancels all open orders.
         """
         pass
 
     @abstractmethod
-    def can_open_position_by_default_rule(
-        self, symbol: str, max_size: float, expected_side: str
+    async def close_allowed_positions_batch(
+        self,
+        symbols: List[str],
+        loss: float,
+        target: float,
+        positions: Optional[Dict[str, PositionSnapshot]] = None,
+    ) -> None:
+        """
+        Same as close_allowed_positions, sharing one position fetch across symbols.
+        """
+        pass
+
+    @abstractmethod
+    async def can_open_position_by_default_rule(
+        self,
+        symbol: str,
+        max_size: float,
+        expected_side: str,
+        position: Optional[PositionSnapshot] = None,
     ) -> bool:
         """
         Checks if a new position can be opened based on default rules.
@@ -84,15 +165,22 @@ class IFuturesTradingAdapter(ABC):
         pass
 
     @abstractmethod
-    def get_last_trade_price(self, symbol: str) -> Optional[float]:
+    async def get_last_trade_price(self, symbol: str) -> Optional[float]:
         """
         Fetches the last traded price for the given symbol.
         """
         pass
 
     @abstractmethod
-    def open_position(self, symbol: str, side: str, amount: float) -> None:
+    async def open_position(self, symbol: str, side: str, amount: float) -> None:
         """
         Opens a new position for the given symbol.
         """
         pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """
+        Stops background streams and releases the exchange connections.
+        """
+        pass
@@ -0,0 +1,58 @@
+import queue
+import threading
+from typing import Optional
+
+from src.adapters.notification.interfaces.i_notification_adapter import (
+    INotificationAdapter,
+)
+from src.configs.logger_config import logger
+
+
+class NotificationDispatcher(INotificationAdapter):
+    """
+    Delivers messages through another notification adapter on a background thread,
+    so callers on the trading path only enqueue and return.
+
+    The queue is bounded: when it is full the oldest pending message is dropped.
+    """
+
+    def __init__(self, adapter: INotificationAdapter, maxsize: int = 100) -> None:
+        self._adapter = adapter
+        self._queue: queue.Queue[Optional[str]] = queue.Queue(maxsize=maxsize)
+        self._worker = threading.Thread(
+            target=self._sender_loop, name="notification-dispatcher", daemon=True
+        )
+        self._worker.start()
+
+    def send_message(self, message: str) -> None:
+        while True:
+            try:
+                self._queue.put_nowait(message)
+                return
+            except queue.Full:
+                try:
+                    dropped = self._queue.get_nowait()
+                    logger.warning(
+                        f"Fila de notificações cheia, descartando: {dropped}"
+                    )
+                except queue.Empty:
+                    pass
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Stops the worker after the messages already queued are sent.
+
+        :param timeout: Maximum time, in seconds, to wait for the worker.
+        """
+        self._queue.put(None)
+        self._worker.join(timeout)
+
+    def _sender_loop(self) -> None:
+        while True:
+            message = self._queue.get()
+            if message is None:
+                return
+            try:
+                self._adapter.send_message(message)
+            except Exception as e:
+                logger.error(f"Erro ao enviar notificação: {e}")
@@ -1,3 +1,52 @@
+# Templates montados uma única vez na importação; por mensagem só ocorre a substituição.
+_POSITION_DETAILS_TEMPLATE = (
+    "*Position:*\n"
+    "• *Pair*: `{symbol}`\n"
+    "• *Size*: `{position_size}`\n"
+    "• *Stop\\-Loss*: `{stop_loss}`%\n"
+    "• *Profit\\-Target*: `{profit_target}%`\n"
+    "• *Timeframe*: `{timeframe}`\n"
+    "• *Limit*: `{limit}`\n\n"
+    "*Indicators:*\n"
+    "• *date*: `{close_time_str}`\n"
+    "• *RSI*: `{rsi_val:.2f}`\n"
+    "• *EMA\\_20*: `{ema_val:.2f}`\n"
+    "• *MACD*: `{macd_val:.2f}`\n"
+    "• *MACD\\_Signal*: `{macd_signal_val:.2f}`\n"
+    "• *VWAP*: `{vwap_val:.2f}`\n"
+    "• *Price*: `{price_val:.2f}`"
+)
+
+_LONG_POSITION_TEMPLATE = (
+    "\U0001f4c8 *Long position opened* \U0001f4c8 \n\n" + _POSITION_DETAILS_TEMPLATE
+)
+
+_SHORT_POSITION_TEMPLATE = (
+    "\U0001f4c9 *Short position opened* \U0001f4c9\n\n" + _POSITION_DETAILS_TEMPLATE
+)
+
+_CLOSED_POSITION_DETAILS_TEMPLATE = (
+    "*Symbol*: `{symbol}`\n"
+    "*Side*: `{side}`\n"
+    "*Size*: `{size}`\n"
+    "*Entry Price*: `{entry_price}`\n"
+    "*PnL*: `{pnl}`\n"
+    "*Return*: `{percent}%`\n\n"
+)
+
+_STOP_LOSS_TEMPLATE = (
+    "\U0001f534 *STOP\\-LOSS TRIGGERED* \U0001f534\n\n"
+    + _CLOSED_POSITION_DETAILS_TEMPLATE
+    + "*Position closed due to stop\\-loss.*"
+)
+
+_TAKE_PROFIT_TEMPLATE = (
+    "\U0001f7e2 *TAKE\\-PROFIT TRIGGERED* \U0001f7e2\n\n"
+    + _CLOSED_POSITION_DETAILS_TEMPLATE
+    + "*Position closed due to take\\-profit.*"
+)
+
+
 class FutureTradingMessages:
     """
     A helper class to construct formatted trading messages for notifications.
@@ -22,23 +71,20 @@ class FutureTradingMessages:
         """
         Constructs a message for a long position.
         """
-        return (
-            f"\U0001f4c8 *Long position opened* \U0001f4c8 \n\n"
-            "*Position:*\n"
-            f"• *Pair*: `{symbol}`\n"
-            f"• *Size*: `{position_size}`\n"
-            f"• *Stop\-Loss*: `{stop_loss}`%\n"
-            f"• *Profit\-Target*: `{profit_target}%`\n"
-            f"• *Timeframe*: `{timeframe}`\n"
-            f"• *Limit*: `{limit}`\n\n"
-            "*Indicators:*\n"
-            f"• *date*: `{close_time_str}`\n"
-            f"• *RSI*: `{rsi_val:.2f}`\n"
-            f"• *EMA\_20*: `{ema_val:.2f}`\n"
-            f"• *MACD*: `{macd_val:.2f}`\n"
-            f"• *MACD\_Signal*: `{macd_signal_val:.2f}`\n"
-            f"• *VWAP*: `{vwap_val:.2f}`\n"
-            f"• *Price*: `{price_val:.2f}`"
+        return _LONG_POSITION_TEMPLATE.format(
+            symbol=symbol,
+            position_size=position_size,
+            stop_loss=stop_loss,
+            profit_target=profit_target,
+            timeframe=timeframe,
+            limit=limit,
+            close_time_str=close_time_str,
+            rsi_val=rsi_val,
+            ema_val=ema_val,
+            macd_val=macd_val,
+            macd_signal_val=macd_signal_val,
+            vwap_val=vwap_val,
+            price_val=price_val,
         )
 
     @staticmethod
@@ -60,23 +106,20 @@ class FutureTradingMessages:
         """
         Constructs a message for a short position.
         """
-        return (
-            f"\U0001f4c9 *Short position opened* \U0001f4c9\n\n"
-            "*Position:*\n"
-            f"• *Pair*: `{symbol}`\n"
-            f"• *Size*: `{position_size}`\n"
-            f"• *Stop\-Loss*: `{stop_loss}`%\n"
-            f"• *Profit\-Target*: `{profit_target}%`\n"
-            f"• *Timeframe*: `{timeframe}`\n"
-            f"• *Limit*: `{limit}`\n\n"
-            "*Indicators:*\n"
-            f"• *date*: `{close_time_str}`\n"
-            f"• *RSI*: `{rsi_val:.2f}`\n"
-            f"• *EMA\_20*: `{ema_val:.2f}`\n"
-            f"• *MACD*: `{macd_val:.2f}`\n"
-            f"• *MACD\_Signal*: `{macd_signal_val:.2f}`\n"
-            f"• *VWAP*: `{vwap_val:.2f}`\n"
-            f"• *Price*: `{price_val:.2f}`"
+        return _SHORT_POSITION_TEMPLATE.format(
+            symbol=symbol,
+            position_size=position_size,
+            stop_loss=stop_loss,
+            profit_target=profit_target,
+            timeframe=timeframe,
+            limit=limit,
+            close_time_str=close_time_str,
+            rsi_val=rsi_val,
+            ema_val=ema_val,
+            macd_val=macd_val,
+            macd_signal_val=macd_signal_val,
+            vwap_val=vwap_val,
+            price_val=price_val,
         )
 
     @staticmethod
@@ -91,15 +134,13 @@ class FutureTradingMessages:
         """
         Constructs a message for a stop-loss trigger.
         """
-        return (
-            "\U0001f534 *STOP\-LOSS TRIGGERED* \U0001f534\n\n"
-            f"*Symbol*: `{symbol}`\n"
-            f"*Side*: `{side}`\n"
-            f"*Size*: `{size}`\n"
-            f"*Entry Price*: `{entry_price}`\n"
-            f"*PnL*: `{pnl}`\n"
-            f"*Return*: `{percent}%`\n\n"
-            "*Position closed due to stop\-loss.*"
+        return _STOP_LOSS_TEMPLATE.format(
+            symbol=symbol,
+            side=side,
+            size=size,
+            entry_price=entry_price,
+            pnl=pnl,
+            percent=percent,
         )
 
     @staticmethod
@@ -114,13 +155,11 @@ class FutureTradingMessages:
         """
         Constructs a message for a take-profit trigger.
         """
-        return (
-            "\U0001f7e2 *TAKE\-PROFIT TRIGGERED* \U0001f7e2\n\n"
-            f"*Symbol*: `{symbol}`\n"
-            f"*Side*: `{side}`\n"
-            f"*Size*: `{size}`\n"
-            f"*Entry Price*: `{entry_price}`\n"
-            f"*PnL*: `{pnl}`\n"
-            f"*Return*: `{percent}%`\n\n"
-            "*Position closed due to take\-profit.*"
+        return _TAKE_PROFIT_TEMPLATE.format(
+            symbol=symbol,
+            side=side,
+            size=size,
+            entry_price=entry_price,
+            pnl=pnl,
+            percent=percent,
         )
@@ -2,6 +2,7 @@ import os
 
 import dotenv
 import requests
+from requests.adapters import HTTPAdapter
 
 from src.adapters.notification.interfaces.i_notification_adapter import (
     INotificationAdapter,
@@ -15,12 +16,16 @@ class TelegramAdapter(INotificationAdapter):
     def __init__(self) -> None:
         self.token = os.getenv("TELEGRAM_BOT_TOKEN")
         self.chat_id = os.getenv("TELEGRAM_CHAT_ID")
+        self._url = f"https://api.telegram.org/bot{self.token}/sendMessage"
+
+        # Sessão persistente: reaproveita a conexão TCP/TLS entre notificações.
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
 
     def send_message(self, message: str) -> None:
-        url = f"https://api.telegram.org/bot{self.token}/sendMessage"
         data = {"chat_id": self.chat_id, "text": message, "parse_mode": "MarkdownV2"}
 
-        response = requests.post(url, data=data)
+        response = self._session.post(self._url, data=data, timeout=5)
         response.raise_for_status()
 
         logger.info(f"Notification sent: {message}")
@@ -1,7 +1,7 @@
+import atexit
 import logging
 import logging.config
 import os
-from logging.handlers import RotatingFileHandler
 
 # Cria o diretório de logs, se não existir
 os.makedirs("logs", exist_ok=True)
@@ -35,11 +35,18 @@ LOGGING_CONFIG = {
             "backupCount": 5,
             "encoding": "utf-8",
         },
+        # Quem loga só enfileira o registro; console e arquivo (com rotação)
+        # são escritos pela thread do QueueListener.
+        "queue_handler": {
+            "class": "logging.handlers.QueueHandler",
+            "handlers": ["console", "rotating_file_handler"],
+            "respect_handler_level": True,
+        },
     },
     "loggers": {
         "crypto_trading_bot_logger": {
             "level": "DEBUG",
-            "handlers": ["console", "rotating_file_handler"],
+            "handlers": ["queue_handler"],
             "propagate": False,
         }
     },
@@ -51,6 +58,10 @@ LOGGING_CONFIG = {
 
 logging.config.dictConfig(LOGGING_CONFIG)
 
+queue_listener = logging.getHandlerByName("queue_handler").listener
+queue_listener.start()
+atexit.register(queue_listener.stop)
+
 logger = logging.getLogger("crypto_trading_bot_logger")
 
 __all__ = ["logger"]
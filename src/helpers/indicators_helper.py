@@ -1,6 +1,7 @@
-import pandas as pd
-import pandas_ta as ta
-from ta.momentum import RSIIndicator
+from typing import Tuple
+
+import numpy as np
+import talib
 
 
 class IndicatorsHelper:
@@ -14,86 +15,81 @@ class IndicatorsHelper:
     - VWAP (Volume Weighted Average Price)
     - SMA (Simple Moving Average)
     - Support and Resistance levels
+
+    All methods take float64 NumPy arrays (e.g. the fields of Candles) and call
+    TA-Lib's C functions directly.
     """
 
     @staticmethod
-    def calculate_rsi(df: pd.DataFrame, period: int = 14) -> pd.Series:
+    def calculate_rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
         """
         Calculates the RSI (Relative Strength Index).
 
-        :param df: A DataFrame containing candles with a 'close' column.
+        :param close: An array of close prices.
         :param period: The period for RSI calculation.
-        :return: A Series containing RSI values.
+        :return: An array containing RSI values.
         """
-        rsi = RSIIndicator(df["close"], window=period)
-        return rsi.rsi()
+        return talib.RSI(close, timeperiod=period)
 
     @staticmethod
-    def calculate_ema(df: pd.DataFrame, period: int = 20) -> pd.Series:
+    def calculate_ema(close: np.ndarray, period: int = 20) -> np.ndarray:
         """
         Calculates the EMA (Exponential Moving Average) for a specified period.
 
-        :param df: A DataFrame containing candles with a 'close' column.
+        :param close: An array of close prices.
         :param period: The period for EMA calculation.
-        :return: A Series containing EMA values.
+        :return: An array containing EMA values.
         """
-        return ta.ema(df["close"], length=period)
+        return talib.EMA(close, timeperiod=period)
 
     @staticmethod
     def calculate_macd(
-        df: pd.DataFrame, fast: int = 12, slow: int = 26, signal: int = 9
-    ) -> pd.DataFrame:
+        close: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Calculates the MACD (Moving Average Convergence Divergence).
 
-        :param df: A DataFrame containing candles with a 'close' column.
+        :param close: An array of close prices.
         :param fast: The fast EMA period.
         :param slow: The slow EMA period.
         :param signal: The signal EMA period.
-        :return: A DataFrame with columns:
-                 - MACD_12_26_9
-                 - MACDs_12_26_9 (signal line)
-                 - MACDh_12_26_9 (histogram)
+        :return: A tuple of arrays: MACD line, signal line and histogram.
         """
-        return df.ta.macd(
-            close="close", fast=fast, slow=slow, signal=signal, append=True
-        )
+        return talib.MACD(close, fastperiod=fast, slowperiod=slow, signalperiod=signal)
 
     @staticmethod
-    def calculate_vwap(df: pd.DataFrame) -> pd.Series:
+    def calculate_vwap(close: np.ndarray, volume: np.ndarray) -> float:
         """
         Calculates a simplified VWAP (Volume Weighted Average Price).
 
-        :param df: A DataFrame containing candles with 'close' and 'volume' columns.
-        :return: A Series containing VWAP values, replicated for all rows in the same window.
+        :param close: An array of close prices.
+        :param volume: An array of volumes aligned with `close`.
+        :return: The VWAP over the whole window.
         """
-        df["price_weighted"] = df["close"] * df["volume"]
-        vwap_value = df["price_weighted"].sum() / df["volume"].sum()
-        # Returns a Series with the VWAP value replicated for all rows
-        return pd.Series([vwap_value] * len(df), index=df.index)
+        return float(np.dot(close, volume) / volume.sum())
 
     @staticmethod
-    def calculate_sma(df: pd.DataFrame, period: int = 20) -> pd.Series:
+    def calculate_sma(close: np.ndarray, period: int = 20) -> np.ndarray:
         """
         Calculates the SMA (Simple Moving Average) for a specified period.
 
-        :param df: A DataFrame containing candles with a 'close' column.
+        :param close: An array of close prices.
         :param period: The period for SMA calculation.
-        :return: A Series containing SMA values.
+        :return: An array containing SMA values.
         """
-        return ta.sma(df["close"], length=period)
+        return talib.SMA(close, timeperiod=period)
 
     @staticmethod
     def calculate_support_resistance(
-        df: pd.DataFrame, window: int = 10
-    ) -> pd.DataFrame:
+        low: np.ndarray, high: np.ndarray, window: int = 10
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Calculates support and resistance levels using the minimum and maximum of the last 'window' candles.
+        Calculates support and resistance levels using the minimum and maximum
+        of the last 'window' candles.
 
-        :param df: A DataFrame containing candles with 'low' and 'high' columns.
+        :param low: An array of low prices.
+        :param high: An array of high prices.
         :param window: The number of candles to consider for the calculation.
-        :return: A DataFrame with 'support' and 'resistance' columns.
+        :return: A tuple of arrays: support and resistance.
         """
-        df["support"] = df["low"].rolling(window).min()
-        df["resistance"] = df["high"].rolling(window).max()
-        return df
+        return talib.MIN(low, timeperiod=window), talib.MAX(high, timeperiod=window)
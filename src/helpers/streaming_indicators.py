@@ -0,0 +1,155 @@
+import math
+from collections import deque
+from typing import Deque, NamedTuple, Optional, Tuple
+
+
+class _Ema:
+    """
+    Exponential average seeded with the SMA of the `period` inputs that end at
+    input number `warmup`, as TA-Lib does. `alpha` defaults to 2 / (period + 1);
+    Wilder smoothing is the same recurrence with alpha = 1 / period.
+    """
+
+    def __init__(
+        self, period: int, alpha: Optional[float] = None, warmup: Optional[int] = None
+    ) -> None:
+        self._period = period
+        self._alpha = 2.0 / (period + 1) if alpha is None else alpha
+        self._warmup = warmup or period
+        self._count = 0
+        self._recent: Deque[float] = deque(maxlen=period - 1)
+        self._value = math.nan
+
+    # peek calcula o valor que x produziria sem alterar o estado; push o efetiva.
+    def peek(self, x: float) -> float:
+        if self._count >= self._warmup:
+            return self._value + self._alpha * (x - self._value)
+        if self._count == self._warmup - 1:
+            return (sum(self._recent) + x) / self._period
+        return math.nan
+
+    def push(self, x: float) -> None:
+        self._value = self.peek(x)
+        self._count += 1
+        if self._count < self._warmup:
+            self._recent.append(x)
+
+
+class LastBar(NamedTuple):
+    """
+    Indicator values at the latest candle. NaN while an indicator is warming up.
+    """
+
+    close: float
+    rsi: float
+    ema: float
+    macd: float
+    macd_signal: float
+    vwap: float
+
+
+class StreamingIndicators:
+    """
+    Keeps RSI, EMA, MACD and VWAP state across ticks so that each candle costs O(1).
+
+    Candles are fed in chronological order through `update`. Repeating the timestamp
+    of the latest candle revises it in place (the forming candle); a newer timestamp
+    commits the previous candle to the state. Seeding follows TA-Lib, so fed with a
+    whole window on cold start the values match IndicatorsHelper over that window
+    (MACD is reported before TA-Lib's signal warm-up ends).
+    """
+
+    def __init__(
+        self,
+        rsi_period: int = 14,
+        ema_period: int = 20,
+        macd_fast: int = 12,
+        macd_slow: int = 26,
+        macd_signal: int = 9,
+        vwap_window: int = 48,
+    ) -> None:
+        self._rsi_gain = _Ema(rsi_period, alpha=1.0 / rsi_period)
+        self._rsi_loss = _Ema(rsi_period, alpha=1.0 / rsi_period)
+        self._ema = _Ema(ema_period)
+        # O TA-Lib alinha a EMA rápida para começar junto com a lenta.
+        self._macd_fast = _Ema(macd_fast, warmup=macd_slow)
+        self._macd_slow = _Ema(macd_slow)
+        self._macd_signal = _Ema(macd_signal)
+        self._vwap_window: Deque[Tuple[float, float]] = deque(maxlen=vwap_window - 1)
+        self._vwap_num = 0.0
+        self._vwap_den = 0.0
+
+        self._last_close: Optional[float] = None
+        self._pending: Optional[Tuple[float, float, float]] = None
+
+    @property
+    def last_timestamp(self) -> Optional[float]:
+        """
+        Timestamp of the latest candle fed, or None before the first update.
+        """
+        return self._pending[0] if self._pending else None
+
+    def update(self, timestamp: float, close: float, volume: float) -> LastBar:
+        """
+        Feeds one candle and returns the indicator values including it.
+
+        :param timestamp: The candle open time; older candles are ignored.
+        :param close: The candle close (or latest) price.
+        :param volume: The candle volume.
+        :return: The indicator values including this candle.
+        """
+        if self._pending is not None:
+            if timestamp < self._pending[0]:
+                return self._values()
+            if timestamp > self._pending[0]:
+                self._commit(*self._pending[1:])
+        self._pending = (timestamp, close, volume)
+        return self._values()
+
+    def _commit(self, close: float, volume: float) -> None:
+        if self._last_close is not None:
+            diff = close - self._last_close
+            self._rsi_gain.push(max(diff, 0.0))
+            self._rsi_loss.push(max(-diff, 0.0))
+        self._ema.push(close)
+
+        fast = self._macd_fast.peek(close)
+        slow = self._macd_slow.peek(close)
+        self._macd_fast.push(close)
+        self._macd_slow.push(close)
+        if not math.isnan(slow):
+            self._macd_signal.push(fast - slow)
+
+        if len(self._vwap_window) == self._vwap_window.maxlen:
+            old_pv, old_volume = self._vwap_window[0]
+            self._vwap_num -= old_pv
+            self._vwap_den -= old_volume
+        self._vwap_window.append((close * volume, volume))
+        self._vwap_num += close * volume
+        self._vwap_den += volume
+
+        self._last_close = close
+
+    def _values(self) -> LastBar:
+        _, close, volume = self._pending
+
+        rsi = math.nan
+        if self._last_close is not None:
+            diff = close - self._last_close
+            avg_gain = self._rsi_gain.peek(max(diff, 0.0))
+            avg_loss = self._rsi_loss.peek(max(-diff, 0.0))
+            total = avg_gain + avg_loss
+            if not math.isnan(total):
+                rsi = 100 * avg_gain / total if total else 0.0
+
+        macd = self._macd_fast.peek(close) - self._macd_slow.peek(close)
+        macd_signal = math.nan if math.isnan(macd) else self._macd_signal.peek(macd)
+
+        return LastBar(
+            close=close,
+            rsi=rsi,
+            ema=self._ema.peek(close),
+            macd=macd,
+            macd_signal=macd_signal,
+            vwap=(self._vwap_num + close * volume) / (self._vwap_den + volume),
+        )
@@ -1,10 +1,14 @@
-import decimal
 import os
 import time
-from typing import Optional, Tuple
+from decimal import ROUND_HALF_EVEN, Decimal
+from typing import Dict, Optional, Tuple
 
 import ccxt
+import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+from src.configs.logger_config import logger
 
 load_dotenv()
 
@@ -15,14 +19,38 @@ class BinanceFuturesTradingHelper:
     """
 
     def __init__(self) -> None:
+        # Sessão persistente (como no TelegramAdapter): as chamadas REST
+        # reaproveitam a conexão TCP/TLS em vez de refazer o handshake.
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
         self.binance = ccxt.binance(
             {
+                "session": session,
                 "enableRateLimit": True,
                 "options": {"defaultType": "future"},
                 "apiKey": os.getenv("BINANCE_API_KEY"),
                 "secret": os.getenv("BINANCE_API_SECRET"),
             }
         )
+        self._tick: Dict[str, Decimal] = {}
+
+    def round_to_tick(self, symbol: str, price) -> str:
+        """
+        Rounds a price to the symbol's tick size, as price_to_precision does.
+
+        :param symbol: Trading pair symbol.
+        :param price: The price, as a number or a numeric string.
+        :return: The rounded price as a plain decimal string.
+        """
+        tick = self._tick.get(symbol)
+        if tick is None:
+            # O tick vem dos mercados uma única vez; depois é só aritmética decimal.
+            self.binance.load_markets()
+            tick = Decimal(str(self.binance.market(symbol)["precision"]["price"]))
+            self._tick[symbol] = tick
+
+        steps = (Decimal(str(price)) / tick).to_integral_value(ROUND_HALF_EVEN)
+        return format(steps * tick, "f")
 
     def get_open_positions(
         self, symbol: str
@@ -44,29 +72,31 @@ class BinanceFuturesTradingHelper:
         """
         positions = self.binance.fetch_positions(symbols=[symbol])
         for position in positions:
+            info = position["info"]
             side = position["side"]
-            size = float(position["info"]["positionAmt"].replace("-", ""))
+            amount = info["positionAmt"]
+            size = abs(float(amount)) if amount else 0.0
             entry_price = float(position["entryPrice"])
             notional = float(position["notional"])
             percentage = float(position["percentage"])
-            pnl = float(position["info"]["unRealizedProfit"])
+            pnl = float(info["unRealizedProfit"])
 
             position_open = side in ["long", "short"]
             return side, size, entry_price, position_open, notional, percentage, pnl
 
         return None, None, None, False, None, None, None
 
-    def get_order_book(self, symbol: str) -> Tuple[decimal.Decimal, decimal.Decimal]:
+    def get_order_book(self, symbol: str) -> Tuple[str, str]:
         """
         Retrieves the order book for a given symbol.
 
         :param symbol: Trading pair symbol.
-        :return: Tuple containing the highest bid and lowest ask prices.
+        :return: Tuple containing the highest bid and lowest ask prices, as strings
+                 ready for round_to_tick.
         """
-        order_book = self.binance.fetch_order_book(symbol)
-        bid = decimal.Decimal(order_book["bids"][0][0])
-        ask = decimal.Decimal(order_book["asks"][0][0])
-        return bid, ask
+        # Só o topo do book é usado: a menor profundidade aceita basta.
+        order_book = self.binance.fetch_order_book(symbol, limit=5)
+        return str(order_book["bids"][0][0]), str(order_book["asks"][0][0])
 
     def close_position(self, symbol: str) -> None:
         """
@@ -85,7 +115,7 @@ class BinanceFuturesTradingHelper:
             bid, ask = self.get_order_book(symbol)
 
             if side == "long":
-                ask_price = self.binance.price_to_precision(symbol, float(ask))
+                ask_price = self.round_to_tick(symbol, ask)
                 self.binance.create_order(
                     symbol=symbol,
                     type="limit",
@@ -95,7 +125,7 @@ class BinanceFuturesTradingHelper:
                     params={"hedged": True},
                 )
             elif side == "short":
-                bid_price = self.binance.price_to_precision(symbol, float(bid))
+                bid_price = self.round_to_tick(symbol, bid)
                 self.binance.create_order(
                     symbol=symbol,
                     type="limit",
@@ -120,12 +150,12 @@ class BinanceFuturesTradingHelper:
         if percent is not None:
             if percent < loss:
                 self.close_position(symbol)
-                print(f"Position closed due to stop loss: {pnl}")
+                logger.info("Position closed due to stop loss: %s", pnl)
 
                 # time.sleep(10800)
             elif percent >= target:
                 self.close_position(symbol)
-                print(f"Position closed due to take profit: {pnl}")
+                logger.info("Position closed due to take profit: %s", pnl)
 
     def has_exceeded_max_size(self, symbol: str, max_size: float) -> bool:
         """
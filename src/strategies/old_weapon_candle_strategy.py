@@ -1,17 +1,20 @@
+import logging
 import time
 
-import pandas as pd
-import pandas_ta as ta
-import schedule
-from ta.momentum import RSIIndicator
+import numpy as np
 
-from src.binance_futures_trading_helper import BinanceFuturesTradingHelper
+from src.configs.logger_config import logger
+from src.helpers.indicators_helper import IndicatorsHelper
+from src.old_binance_futures_trading_helper import BinanceFuturesTradingHelper
 
 
 class WeaponCandleStrategy:
+    def __init__(self, helper: BinanceFuturesTradingHelper):
+        self._helper = helper
+
     def job(self):
-        # conexão
-        helper = BinanceFuturesTradingHelper()
+        # conexão compartilhada entre jobs (sessão e mercados já carregados)
+        helper = self._helper
 
         # definir par
         symbol = "BTCUSDT"
@@ -29,43 +32,49 @@ class WeaponCandleStrategy:
         # importar candles
         timeframe = "30m"
         bars = helper.binance.fetch_ohlcv(symbol, timeframe, limit=48)
-        df_candles = pd.DataFrame(
-            bars, columns=["time", "abertura", "max", "min", "fechamento", "volume"]
-        )
-        df_candles["time"] = pd.to_datetime(
-            df_candles["time"], unit="ms", utc=True
-        ).map(lambda x: x.tz_convert("America/Sao_Paulo"))
-
-        # criar métricas da estratégia
-        rsi = RSIIndicator(df_candles["fechamento"], window=14)
-        df_candles["rsi"] = rsi.rsi()
-
-        ema_20 = ta.ema(df_candles["fechamento"], length=20)
-        df_candles["EMA_20"] = ema_20
-
-        df_candles.ta.macd(close="fechamento", fast=12, slow=26, signal=9, append=True)
-
-        df_candles["price_weighted"] = df_candles["fechamento"] * df_candles["volume"]
-        df_candles["VWAP"] = (
-            df_candles["price_weighted"].sum() / df_candles["volume"].sum()
+        # Colunas do ccxt: time, abertura, max, min, fechamento, volume. Só
+        # fechamento e volume entram nas regras; só eles viram arrays contíguos.
+        ohlcv = np.asarray(bars, dtype=np.float64)
+        close = np.ascontiguousarray(ohlcv[:, 4])
+        volume = np.ascontiguousarray(ohlcv[:, 5])
+
+        # criar métricas da estratégia: os indicadores vivem em arrays por
+        # coluna (SoA), lidos pelo último índice.
+        macd, macd_signal, _ = IndicatorsHelper.calculate_macd(
+            close, fast=12, slow=26, signal=9
         )
-
-        print(f"RSI: {df_candles['rsi'].iloc[-1]}")
-        print(f"EMA_20: {df_candles['EMA_20'].iloc[-1]}")
-        print(f"MACD: {df_candles['MACD_12_26_9'].iloc[-1]}")
-        print(f"VWAP: {df_candles['VWAP'].iloc[-1]}")
-        print(f"Preço: {df_candles['fechamento'].iloc[-1]}")
+        indicators = {
+            "fechamento": close,
+            "rsi": IndicatorsHelper.calculate_rsi(close, period=14),
+            "EMA_20": IndicatorsHelper.calculate_ema(close, period=20),
+            "MACD_12_26_9": macd,
+            "MACDs_12_26_9": macd_signal,
+        }
+
+        # Último valor de cada indicador, extraído uma vez para todas as regras.
+        last = {name: float(values[-1]) for name, values in indicators.items()}
+        last["VWAP"] = IndicatorsHelper.calculate_vwap(close, volume)
+
+        # Só monta o texto dos indicadores se o nível DEBUG estiver ativo.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "RSI: %s | EMA_20: %s | MACD: %s | VWAP: %s | Preço: %s",
+                last["rsi"],
+                last["EMA_20"],
+                last["MACD_12_26_9"],
+                last["VWAP"],
+                last["fechamento"],
+            )
 
         # condições de long e short
         price = helper.binance.fetch_trades(symbol, limit=1)[0]["price"]
-        price = float(helper.binance.price_to_precision(symbol, price))
+        price = float(helper.round_to_tick(symbol, price))
 
         if (
-            df_candles["rsi"].iloc[-1] <= 30
-            and price >= df_candles["EMA_20"].iloc[-1]
-            and price >= df_candles["VWAP"].iloc[-1]
-            and df_candles["MACD_12_26_9"].iloc[-1]
-            >= df_candles["MACDs_12_26_9"].iloc[-1]
+            last["rsi"] <= 30
+            and price >= last["EMA_20"]
+            and price >= last["VWAP"]
+            and last["MACD_12_26_9"] >= last["MACDs_12_26_9"]
         ):
             if (
                 not helper.has_exceeded_max_size(symbol, posicao_max)
@@ -74,7 +83,7 @@ class WeaponCandleStrategy:
             ):
                 try:
                     bid, ask = helper.get_order_book(symbol)
-                    bid_price = helper.binance.price_to_precision(symbol, float(bid))
+                    bid_price = helper.round_to_tick(symbol, bid)
                     helper.binance.create_order(
                         symbol=symbol,
                         type="limit",
@@ -84,17 +93,19 @@ class WeaponCandleStrategy:
                         params={"hedged": True},
                     )
 
-                    print(
-                        f"Abrindo posição long em {bid_price}, tamanho {posicao}, par {symbol}"
+                    logger.info(
+                        "Abrindo posição long em %s, tamanho %s, par %s",
+                        bid_price,
+                        posicao,
+                        symbol,
                     )
                 except Exception as e:
-                    print(f"Erro ao abrir posição long: {e}")
+                    logger.error("Erro ao abrir posição long: %s", e)
         elif (
-            df_candles["rsi"].iloc[-1] >= 70
-            and price <= df_candles["EMA_20"].iloc[-1]
-            and price <= df_candles["VWAP"].iloc[-1]
-            and df_candles["MACD_12_26_9"].iloc[-1]
-            <= df_candles["MACDs_12_26_9"].iloc[-1]
+            last["rsi"] >= 70
+            and price <= last["EMA_20"]
+            and price <= last["VWAP"]
+            and last["MACD_12_26_9"] <= last["MACDs_12_26_9"]
         ):
             if (
                 not helper.has_exceeded_max_size(symbol, posicao_max)
@@ -103,7 +114,7 @@ class WeaponCandleStrategy:
             ):
                 try:
                     bid, ask = helper.get_order_book(symbol)
-                    ask_price = helper.binance.price_to_precision(symbol, float(ask))
+                    ask_price = helper.round_to_tick(symbol, ask)
                     helper.binance.create_order(
                         symbol=symbol,
                         type="limit",
@@ -113,22 +124,33 @@ class WeaponCandleStrategy:
                         params={"hedged": True},
                     )
 
-                    print(
-                        f"Abrindo posição short em {ask_price}, tamanho {posicao}, par {symbol}"
+                    logger.info(
+                        "Abrindo posição short em %s, tamanho %s, par %s",
+                        ask_price,
+                        posicao,
+                        symbol,
                     )
                 except Exception as e:
-                    print(f"Erro ao abrir posição short: {e}")
+                    logger.error("Erro ao abrir posição short: %s", e)
         else:
-            print("Nenhuma condição atendida para abrir posição")
+            logger.info("Nenhuma condição atendida para abrir posição")
 
 
 if __name__ == "__main__":
-    strategy = WeaponCandleStrategy()
-    schedule.every(5).seconds.do(strategy.job)
-
+    # Um único cliente para todo o processo; os mercados (tick, precisão) são
+    # carregados uma vez aqui, não no primeiro job.
+    helper = BinanceFuturesTradingHelper()
+    helper.binance.load_markets()
+    strategy = WeaponCandleStrategy(helper)
+
+    # Intervalo medido no relógio monotônico, dormindo até o próximo job.
+    next_run = time.monotonic()
     while True:
         try:
-            schedule.run_pending()
+            strategy.job()
+            next_run += 5
         except Exception as e:
-            print(f"Erro no loop principal: {e}")
-            time.sleep(10)
+            logger.error("Erro no loop principal: %s", e)
+            next_run += 10
+        time.sleep(max(0.0, next_run - time.monotonic()))
+        next_run = max(next_run, time.monotonic())
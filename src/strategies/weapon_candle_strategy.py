@@ -1,26 +1,58 @@
-import time
+import asyncio
+from typing import Awaitable, Callable, Optional
 
+import numba
+import numpy as np
 import pandas as pd
-import schedule
+
+try:
+    import uvloop
+except ImportError:  # uvloop não existe no Windows; cai no loop padrão.
+    uvloop = None
 
 from src.adapters.exchanges.binance.binance_futures_trading_adapter import (
     BinanceFuturesTradingAdapter,
 )
 from src.adapters.exchanges.interfaces.i_futures_trading_adapter import (
+    Candles,
     IFuturesTradingAdapter,
+    PositionSnapshot,
+)
+from src.adapters.notification.dispatcher.notification_dispatcher import (
+    NotificationDispatcher,
+)
+from src.adapters.notification.interfaces.i_notification_adapter import (
+    INotificationAdapter,
 )
 from src.adapters.notification.messages.future_trading_messages import (
     FutureTradingMessages,
 )
 from src.adapters.notification.telegram.telegram_adapter import TelegramAdapter
 from src.configs.logger_config import logger
-from src.helpers.indicators_helper import IndicatorsHelper
+from src.helpers.streaming_indicators import LastBar, StreamingIndicators
+
+
+# Sem fastmath: nos primeiros candles os indicadores ainda são NaN e as
+# comparações precisam seguir o IEEE (NaN nunca satisfaz a regra).
+@numba.njit(cache=True)
+def _decide(
+    rsi: float, ema: float, vwap: float, macd: float, macd_signal: float, price: float
+) -> int:
+    if rsi <= 30 and price >= ema and price >= vwap and macd >= macd_signal:
+        return 1
+    if rsi >= 70 and price <= ema and price <= vwap and macd <= macd_signal:
+        return -1
+    return 0
+
+
+# Lado de entrada para cada resultado do _decide; 0 (sem entrada) fica de fora.
+_ENTRY_SIDES = {1: "long", -1: "short"}
 
 
 class WeaponCandleStrategy:
     def __init__(
         self,
-        notification_adapter: TelegramAdapter,
+        notification_adapter: INotificationAdapter,
         futures_trading_adapter: IFuturesTradingAdapter,
         symbol: str = "BTCUSDT",
         load_candles_timeframe: str = "30m",
@@ -40,172 +72,216 @@ class WeaponCandleStrategy:
         self._profit_target = profit_target
         self._max_position_size = max_position_size
         self._position_size = position_size
+        self._indicators = StreamingIndicators(vwap_window=load_candles_limit)
+        # Compila (ou carrega do cache) o kernel antes do primeiro tick.
+        _decide(50.0, 0.0, 0.0, 0.0, 0.0, 0.0)
 
         logger.info(
-            f"Strategy init: {self._symbol} TF={self._load_candles_timeframe}, "
-            f"Stop={self._stop_loss}%, Target={self._profit_target}%, "
-            f"MaxSize={self._max_position_size}, Size={self._position_size}"
+            "Strategy init: %s TF=%s, Stop=%s%%, Target=%s%%, MaxSize=%s, Size=%s",
+            self._symbol,
+            self._load_candles_timeframe,
+            self._stop_loss,
+            self._profit_target,
+            self._max_position_size,
+            self._position_size,
         )
 
-    def execute_strategy(self):
-        logger.info(f"Executando estratégia para {self._symbol}...")
-        self.close_allowed_positions()
-        df_candles = self.load_candles()
-        df_candles = self.calculate_indicators(df_candles)
-        self.check_and_place_orders(df_candles)
+    async def execute_strategy(self):
+        # Argumentos no estilo %: o texto só é montado se algum handler aceitar
+        # o registro, e não a cada tick de forma incondicional.
+        logger.info("Executando estratégia para %s...", self._symbol)
+        # Um único snapshot da posição por tick, repassado a todas as regras.
+        # Se a gestão fechar a posição, o snapshot antigo só torna as regras
+        # de abertura mais conservadoras até o próximo tick.
+        position = await self._trading_adapter.get_open_positions(self._symbol)
+        # Gestão das posições, candles e último preço não dependem entre si.
+        # Espera todas terminarem antes de propagar um erro: um fechamento
+        # ainda em curso não pode se sobrepor ao do próximo tick.
+        results = await asyncio.gather(
+            self.close_allowed_positions(position),
+            self.load_candles(),
+            self._trading_adapter.get_last_trade_price(self._symbol),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        _, candles, price = results
+        bar = self.calculate_indicators(candles)
+        await self.check_and_place_orders(bar, price, position)
 
-    def close_allowed_positions(self):
-        self._trading_adapter.close_allowed_positions(
-            symbol=self._symbol, loss=self._stop_loss, target=self._profit_target
+    async def close_allowed_positions(self, position: PositionSnapshot):
+        await self._trading_adapter.close_allowed_positions(
+            symbol=self._symbol,
+            loss=self._stop_loss,
+            target=self._profit_target,
+            position=position,
         )
 
-    def load_candles(self) -> pd.DataFrame:
-        df = self._trading_adapter.load_candles(
+    async def load_candles(self) -> Candles:
+        candles = await self._trading_adapter.load_candles(
             symbol=self._symbol,
             timeframe=self._load_candles_timeframe,
             limit=self._load_candles_limit,
         )
-        logger.info(f"Candles carregados para {self._symbol}.")
-        return df
-
-    def calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
-        df["rsi"] = IndicatorsHelper.calculate_rsi(df)
-        df["EMA_20"] = IndicatorsHelper.calculate_ema(df)
-        IndicatorsHelper.calculate_macd(df)
-        df["VWAP"] = IndicatorsHelper.calculate_vwap(df)
-        logger.info(f"Indicadores calculados para {self._symbol}.")
-        return df
-
-    def check_and_place_orders(self, df: pd.DataFrame):
+        logger.info("Candles carregados para %s.", self._symbol)
+        return candles
+
+    def calculate_indicators(self, candles: Candles) -> Optional[LastBar]:
+        # Só alimenta candles a partir do último já processado: os anteriores
+        # estão no estado e o candle em formação é revisado. Na partida a
+        # janela inteira é processada uma vez.
+        times = candles.time
+        if not len(times):
+            logger.warning("Nenhum candle disponível para %s.", self._symbol)
+            return None
+        start = 0
+        if self._indicators.last_timestamp is not None:
+            start = min(
+                int(np.searchsorted(times, self._indicators.last_timestamp)),
+                len(times) - 1,
+            )
+        for i in range(start, len(times)):
+            bar = self._indicators.update(times[i], candles.close[i], candles.volume[i])
+        logger.info("Indicadores calculados para %s.", self._symbol)
+        return bar
+
+    async def check_and_place_orders(
+        self,
+        bar: Optional[LastBar],
+        price: Optional[float],
+        position: PositionSnapshot,
+    ):
+        if bar is None or price is None:
+            return
+
+        # Regra de entrada é aritmética pura: fica fora do try, que cobre só
+        # as chamadas ao adapter e ao notificador.
+        side = _ENTRY_SIDES.get(
+            _decide(bar.rsi, bar.ema, bar.vwap, bar.macd, bar.macd_signal, price)
+        )
+        if side is None:
+            # Sem condições de entrada, menos log detalhado.
+            logger.info("Nenhuma condição de entrada atendida em %s.", self._symbol)
+            return
+
         try:
-            price = self._trading_adapter.get_last_trade_price(self._symbol)
-            if price is None:
+            if not await self._trading_adapter.can_open_position_by_default_rule(
+                self._symbol,
+                self._max_position_size,
+                expected_side=side,
+                position=position,
+            ):
+                logger.info(
+                    "Condições %s atendidas, mas regras padrão vetam abertura em %s.",
+                    side.upper(),
+                    self._symbol,
+                )
                 return
 
-            rsi_val = df["rsi"].iloc[-1]
-            ema_val = df["EMA_20"].iloc[-1]
-            macd_val = df["MACD_12_26_9"].iloc[-1]
-            macd_signal_val = df["MACDs_12_26_9"].iloc[-1]
-            vwap_val = df["VWAP"].iloc[-1]
-            price_val = df["close"].iloc[-1]
-
-            if "close_time" in df.columns:
-                close_time_str = str(df["close_time"].iloc[-1])
-            else:
-                close_time_str = pd.Timestamp.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-
-            if self.can_open_long_position_by_strategy_rule(df, price):
-                if self._trading_adapter.can_open_position_by_default_rule(
-                    self._symbol, self._max_position_size, expected_side="long"
-                ):
-                    message = FutureTradingMessages.create_long_position_message(
-                        symbol=self._symbol,
-                        position_size=self._position_size,
-                        stop_loss=self._stop_loss,
-                        profit_target=self._profit_target,
-                        timeframe=self._load_candles_timeframe,
-                        limit=self._load_candles_limit,
-                        close_time_str=close_time_str,
-                        rsi_val=rsi_val,
-                        ema_val=ema_val,
-                        macd_val=macd_val,
-                        macd_signal_val=macd_signal_val,
-                        vwap_val=vwap_val,
-                        price_val=price_val,
-                    )
-                    self._trading_adapter.open_position(
-                        self._symbol, "long", self._position_size
-                    )
-                    self._notification_adapter.send_message(message)
-                    logger.info(
-                        f"Condições LONG atendidas, posição pode ser aberta em {self._symbol}."
-                    )
-                else:
-                    logger.info(
-                        f"Condições LONG atendidas, mas regras padrão vetam abertura em {self._symbol}."
-                    )
-            elif self.can_open_short_position_by_strategy(df, price):
-                if self._trading_adapter.can_open_position_by_default_rule(
-                    self._symbol, self._max_position_size, expected_side="short"
-                ):
-                    message = FutureTradingMessages.create_short_position_message(
-                        symbol=self._symbol,
-                        position_size=self._position_size,
-                        stop_loss=self._stop_loss,
-                        profit_target=self._profit_target,
-                        timeframe=self._load_candles_timeframe,
-                        limit=self._load_candles_limit,
-                        close_time_str=close_time_str,
-                        rsi_val=rsi_val,
-                        ema_val=ema_val,
-                        macd_val=macd_val,
-                        macd_signal_val=macd_signal_val,
-                        vwap_val=vwap_val,
-                        price_val=price_val,
-                    )
-                    self._trading_adapter.open_position(
-                        self._symbol, "short", self._position_size
-                    )
-                    self._notification_adapter.send_message(message)
-                    logger.info(
-                        f"Condições SHORT atendidas, posição pode ser aberta em {self._symbol}."
-                    )
-                else:
-                    logger.info(
-                        f"Condições SHORT atendidas, mas regras padrão vetam abertura em {self._symbol}."
-                    )
-            else:
-                # Sem condições de entrada, menos log detalhado.
-                logger.info(f"Nenhuma condição de entrada atendida em {self._symbol}.")
+            create_message = (
+                FutureTradingMessages.create_long_position_message
+                if side == "long"
+                else FutureTradingMessages.create_short_position_message
+            )
+            message = create_message(
+                symbol=self._symbol,
+                position_size=self._position_size,
+                stop_loss=self._stop_loss,
+                profit_target=self._profit_target,
+                timeframe=self._load_candles_timeframe,
+                limit=self._load_candles_limit,
+                close_time_str=pd.Timestamp.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+                rsi_val=bar.rsi,
+                ema_val=bar.ema,
+                macd_val=bar.macd,
+                macd_signal_val=bar.macd_signal,
+                vwap_val=bar.vwap,
+                price_val=bar.close,
+            )
+            await self._trading_adapter.open_position(
+                self._symbol, side, self._position_size
+            )
+            self._notification_adapter.send_message(message)
+            logger.info(
+                "Condições %s atendidas, posição pode ser aberta em %s.",
+                side.upper(),
+                self._symbol,
+            )
         except Exception as e:
             logger.error(
-                f"Erro ao verificar condições de entrada para {self._symbol}: {e}"
+                "Erro ao verificar condições de entrada para %s: %s", self._symbol, e
             )
 
-    def can_open_long_position_by_strategy_rule(
-        self, df: pd.DataFrame, price: float
-    ) -> bool:
-        return (
-            df["rsi"].iloc[-1] <= 30
-            and price >= df["EMA_20"].iloc[-1]
-            and price >= df["VWAP"].iloc[-1]
-            and df["MACD_12_26_9"].iloc[-1] >= df["MACDs_12_26_9"].iloc[-1]
-        )
 
-    def can_open_short_position_by_strategy(
-        self, df: pd.DataFrame, price: float
-    ) -> bool:
-        return (
-            df["rsi"].iloc[-1] >= 70
-            and price <= df["EMA_20"].iloc[-1]
-            and price <= df["VWAP"].iloc[-1]
-            and df["MACD_12_26_9"].iloc[-1] <= df["MACDs_12_26_9"].iloc[-1]
-        )
+async def run_periodic(
+    fn: Callable[[], Awaitable[None]], interval: float, error_interval: float
+) -> None:
+    # Agenda pelo relógio monotônico do loop: o intervalo conta entre inícios
+    # de execução, então o tempo gasto no tick não acumula deriva.
+    loop = asyncio.get_running_loop()
+    next_run = loop.time()
+    while True:
+        try:
+            await fn()
+            next_run += interval
+        except Exception as e:
+            logger.error("Erro no loop principal: %s", e)
+            next_run += error_interval
+        # Tick mais longo que o intervalo: segue a partir de agora, sem rajadas.
+        next_run = max(next_run, loop.time())
+        await asyncio.sleep(next_run - loop.time())
 
 
-if __name__ == "__main__":
-    notification_adapter = TelegramAdapter()
+async def main():
+    notification_adapter = NotificationDispatcher(TelegramAdapter())
     futures_trading_adapter = BinanceFuturesTradingAdapter(
         notification_adapter=notification_adapter
     )
 
-    strategy = WeaponCandleStrategy(
-        notification_adapter=notification_adapter,
-        futures_trading_adapter=futures_trading_adapter,
-        symbol="BTCUSDT",
-        load_candles_timeframe="30m",
-        load_candles_limit=48,
-        stop_loss=-4,
-        profit_target=8,
-        max_position_size=0.004,
-        position_size=0.002,
-    )
+    symbols = ("BTCUSDT",)
+    # Uma estratégia por símbolo, todas sobre o mesmo adapter (streams, caches
+    # e limites de REST compartilhados).
+    strategies = [
+        WeaponCandleStrategy(
+            notification_adapter=notification_adapter,
+            futures_trading_adapter=futures_trading_adapter,
+            symbol=symbol,
+            load_candles_timeframe="30m",
+            load_candles_limit=48,
+            stop_loss=-4,
+            profit_target=8,
+            max_position_size=0.004,
+            position_size=0.002,
+        )
+        for symbol in symbols
+    ]
 
-    schedule.every(5).seconds.do(strategy.execute_strategy)
+    async def execute_strategies() -> None:
+        # Os símbolos rodam em paralelo: o tick dura o do mais lento, não a soma.
+        # A falha de um símbolo é registrada sem interromper os demais; ao fim,
+        # qualquer falha é propagada para o run_periodic aplicar o intervalo
+        # de erro.
+        results = await asyncio.gather(
+            *(strategy.execute_strategy() for strategy in strategies),
+            return_exceptions=True,
+        )
+        failed = []
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                logger.error("Erro ao executar estratégia para %s: %s", symbol, result)
+                failed.append(symbol)
+            elif isinstance(result, BaseException):
+                raise result
+        if failed:
+            raise RuntimeError(f"Estratégias com falha: {', '.join(failed)}")
 
-    while True:
-        try:
-            schedule.run_pending()
-        except Exception as e:
-            logger.error(f"Erro no loop principal: {e}")
-            time.sleep(10)
+    try:
+        await run_periodic(execute_strategies, interval=5, error_interval=10)
+    finally:
+        await futures_trading_adapter.close()
+        notification_adapter.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(), loop_factory=uvloop.new_event_loop if uvloop else None)
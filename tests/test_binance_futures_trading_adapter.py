@@ -0,0 +1,179 @@
+import asyncio
+
+import pytest
+
+from src.adapters.exchanges.binance.binance_futures_trading_adapter import (
+    BinanceFuturesTradingAdapter,
+)
+
+SYMBOL = "BTC/USDT:USDT"
+
+
+class FakeBinance:
+    def __init__(self, rest_positions):
+        self.rest_positions = rest_positions
+        self.fetched = []
+
+    async def fetch_positions(self, symbols=None, params=None):
+        self.fetched.append(symbols)
+        return self.rest_positions
+
+    async def watch_orders(self):
+        return []
+
+
+def _account_update_position():
+    # Formato do parse_ws_position: sem notional, percentage ou margem inicial.
+    return {
+        "symbol": SYMBOL,
+        "side": "long",
+        "contracts": 0.01,
+        "entryPrice": 100.0,
+        "unrealizedPnl": 0.0,
+        "notional": None,
+        "percentage": None,
+        "initialMarginPercentage": None,
+    }
+
+
+def _rest_position():
+    return dict(
+        _account_update_position(),
+        notional=1.0,
+        percentage=0.0,
+        initialMarginPercentage=0.1,
+    )
+
+
+def _adapter(monkeypatch, rest_positions):
+    adapter = BinanceFuturesTradingAdapter(None)
+
+    async def market_symbol(symbol):
+        return symbol
+
+    monkeypatch.setattr(adapter, "binance", FakeBinance(rest_positions))
+    monkeypatch.setattr(adapter, "_market_symbol", market_symbol)
+    monkeypatch.setattr(adapter, "_ensure_positions_stream", lambda: None)
+    monkeypatch.setattr(adapter, "_ensure_mark_price_stream", lambda *a: None)
+    adapter._positions_synced = True
+    return adapter
+
+
+def test_account_update_position_follows_mark_price(monkeypatch):
+    adapter = _adapter(monkeypatch, [_rest_position()])
+    adapter._cache_position(_account_update_position())
+
+    async def percent_at(mark_price):
+        adapter._mark_prices[SYMBOL] = mark_price
+        return (await adapter.get_open_positions(SYMBOL)).percent
+
+    # PnL sobre a margem inicial (10% do notional ao mark price).
+    assert asyncio.run(percent_at(95.0)) == pytest.approx(-5 / 9.5 * 100)
+    assert asyncio.run(percent_at(110.0)) == pytest.approx(10 / 11 * 100)
+    # A margem inicial é buscada uma única vez; depois o cache basta.
+    assert adapter.binance.fetched == [[SYMBOL]]
+
+
+def test_position_without_mark_price_is_read_from_rest(monkeypatch):
+    rest_position = dict(_rest_position(), percentage=-12.5)
+    adapter = _adapter(monkeypatch, [rest_position])
+    adapter._cache_position(_rest_position())
+
+    snapshot = asyncio.run(adapter.get_open_positions(SYMBOL))
+
+    assert snapshot.percent == -12.5
+    assert adapter.binance.fetched == [[SYMBOL]]
+
+
+def test_order_update_during_seeding_is_applied(monkeypatch):
+    adapter = _adapter(monkeypatch, [])
+    stream = {}
+    monkeypatch.setattr(adapter, "_ensure_stream", lambda name, start: start())
+    monkeypatch.setattr(
+        adapter,
+        "_run_stream",
+        lambda name, watch, on_update, on_error: stream.setdefault("update", on_update),
+    )
+    resting = {"id": "1", "symbol": SYMBOL, "status": "open"}
+
+    async def fetch_open_orders(symbol=None):
+        # A execução chega pelo stream enquanto o REST ainda responde.
+        stream["update"]([dict(resting, status="closed")])
+        return [resting]
+
+    adapter.binance.fetch_open_orders = fetch_open_orders
+
+    result = asyncio.run(adapter.is_last_order_open_batch([SYMBOL]))
+
+    assert result == {SYMBOL: False}
+    assert adapter._orders_seeding == {}
+
+
+TIMEFRAME_MS = 1_800_000
+
+
+def _kline(index, close):
+    return [float(index * TIMEFRAME_MS), close, close + 1, close - 1, close, 10.0]
+
+
+def _candle_adapter(monkeypatch, responses):
+    adapter = _adapter(monkeypatch, [])
+    monkeypatch.setattr(adapter, "_ensure_ohlcv_stream", lambda *a: None)
+    calls = []
+
+    async def fetch_ohlcv(symbol, timeframe, since=None, limit=None):
+        calls.append((since, limit))
+        return responses.pop(0)
+
+    adapter.binance.fetch_ohlcv = fetch_ohlcv
+    adapter.binance.parse_timeframe = lambda timeframe: TIMEFRAME_MS // 1000
+    return adapter, calls
+
+
+def _reload(adapter, delta_calls):
+    async def run():
+        await adapter.load_candles(SYMBOL, "30m", limit=4)
+        # Stream interrompido: a próxima leitura recarrega só o delta.
+        adapter._stale_candles.add((SYMBOL, "30m"))
+        return await adapter.load_candles(SYMBOL, "30m", limit=4)
+
+    candles = asyncio.run(run())
+    assert delta_calls[1] == (3 * TIMEFRAME_MS, 2)
+    assert adapter._stale_candles == set()
+    return candles
+
+
+def test_delta_reload_revises_forming_candle(monkeypatch):
+    seed = [_kline(i, 100.0 + i) for i in range(4)]
+    adapter, calls = _candle_adapter(monkeypatch, [seed, [_kline(3, 110.0)]])
+
+    candles = _reload(adapter, calls)
+
+    assert list(candles.time) == [i * TIMEFRAME_MS for i in range(4)]
+    assert list(candles.close) == [100.0, 101.0, 102.0, 110.0]
+    assert candles.high[-1] == 111.0
+
+
+def test_delta_reload_appends_new_candle(monkeypatch):
+    seed = [_kline(i, 100.0 + i) for i in range(4)]
+    delta = [_kline(3, 110.0), _kline(4, 111.0)]
+    adapter, calls = _candle_adapter(monkeypatch, [seed, delta])
+
+    candles = _reload(adapter, calls)
+
+    # A janela desliza um candle e mantém o tamanho, sem REST completo.
+    assert list(candles.time) == [i * TIMEFRAME_MS for i in range(1, 5)]
+    assert list(candles.close) == [101.0, 102.0, 110.0, 111.0]
+    assert len(calls) == 2
+
+
+def test_delta_reload_with_gap_reseeds_window(monkeypatch):
+    seed = [_kline(i, 100.0 + i) for i in range(4)]
+    gap = [_kline(5, 120.0)]
+    reseed = [_kline(i, 200.0 + i) for i in range(2, 6)]
+    adapter, calls = _candle_adapter(monkeypatch, [seed, gap, reseed])
+
+    candles = _reload(adapter, calls)
+
+    assert calls[2] == (None, 4)
+    assert list(candles.close) == [202.0, 203.0, 204.0, 205.0]
@@ -0,0 +1,75 @@
+import math
+
+import numpy as np
+import pytest
+import talib
+
+from src.helpers.streaming_indicators import StreamingIndicators
+
+N = 60
+VWAP_WINDOW = 48
+
+
+def _window(seed=0):
+    rng = np.random.default_rng(seed)
+    time = 1_700_000_000_000 + np.arange(N, dtype=float) * 1_800_000
+    close = 100 + np.cumsum(rng.normal(0, 1, N))
+    volume = rng.uniform(1, 10, N)
+    return time, close, volume
+
+
+def _assert_matches(actual, expected):
+    # Antes do aquecimento do TA-Lib o valor de referência é NaN: sem paridade.
+    if not math.isnan(expected):
+        assert actual == pytest.approx(expected, rel=1e-9, abs=1e-9)
+
+
+def test_cold_start_matches_talib():
+    time, close, volume = _window()
+    indicators = StreamingIndicators(vwap_window=VWAP_WINDOW)
+
+    for i in range(N):
+        bar = indicators.update(time[i], close[i], volume[i])
+        window = close[: i + 1]
+        macd, macd_signal, _ = talib.MACD(window, 12, 26, 9)
+        start = max(0, i + 1 - VWAP_WINDOW)
+
+        assert bar.close == close[i]
+        _assert_matches(bar.rsi, talib.RSI(window, 14)[-1])
+        _assert_matches(bar.ema, talib.EMA(window, 20)[-1])
+        _assert_matches(bar.macd, macd[-1])
+        _assert_matches(bar.macd_signal, macd_signal[-1])
+        _assert_matches(
+            bar.vwap,
+            (close[start : i + 1] * volume[start : i + 1]).sum()
+            / volume[start : i + 1].sum(),
+        )
+
+    # Com a janela inteira todos os indicadores já saíram do aquecimento.
+    assert not any(math.isnan(value) for value in bar)
+
+
+def test_same_timestamp_revises_forming_candle():
+    time, close, volume = _window()
+    revised = StreamingIndicators(vwap_window=VWAP_WINDOW)
+    for i in range(N):
+        revised.update(time[i], close[i], volume[i])
+    bar = revised.update(time[-1], close[-1] + 5.0, volume[-1] * 2)
+
+    close[-1] += 5.0
+    volume[-1] *= 2
+    fresh = StreamingIndicators(vwap_window=VWAP_WINDOW)
+    for i in range(N):
+        expected = fresh.update(time[i], close[i], volume[i])
+
+    assert bar == pytest.approx(expected)
+    assert revised.last_timestamp == time[-1]
+
+
+def test_older_timestamp_is_ignored():
+    time, close, volume = _window()
+    indicators = StreamingIndicators(vwap_window=VWAP_WINDOW)
+    for i in range(N):
+        bar = indicators.update(time[i], close[i], volume[i])
+
+    assert indicators.update(time[-2], 1.0, 1.0) == bar
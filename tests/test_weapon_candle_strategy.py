@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from src.adapters.exchanges.interfaces.i_futures_trading_adapter import Candles
+from src.helpers.streaming_indicators import StreamingIndicators
+from src.strategies.weapon_candle_strategy import WeaponCandleStrategy
+
+LIMIT = 48
+
+
+def _candles(time, close, volume):
+    return Candles(time, close, close, close, close, volume)
+
+
+def test_calculate_indicators_resumes_from_last_candle():
+    rng = np.random.default_rng(1)
+    n = LIMIT + 2
+    time = 1_700_000_000_000 + np.arange(n, dtype=float) * 1_800_000
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    volume = rng.uniform(1, 10, n)
+    strategy = WeaponCandleStrategy(None, None, load_candles_limit=LIMIT)
+
+    # Partida, depois o candle em formação revisado e, por fim, a janela
+    # deslizando um candle: cada chamada retoma do último timestamp visto.
+    strategy.calculate_indicators(_candles(time[:LIMIT], close[:LIMIT], volume[:LIMIT]))
+    forming = close[: LIMIT + 1].copy()
+    forming[-1] -= 3.0
+    strategy.calculate_indicators(
+        _candles(time[1 : LIMIT + 1], forming[1:], volume[1 : LIMIT + 1])
+    )
+    bar = strategy.calculate_indicators(_candles(time[2:], close[2:], volume[2:]))
+
+    fresh = StreamingIndicators(vwap_window=LIMIT)
+    for i in range(n):
+        expected = fresh.update(time[i], close[i], volume[i])
+    assert bar == pytest.approx(expected)
+
+
+def test_calculate_indicators_skips_empty_window():
+    strategy = WeaponCandleStrategy(None, None, load_candles_limit=LIMIT)
+    empty = np.empty(0)
+
+    assert strategy.calculate_indicators(_candles(empty, empty, empty)) is None